@@ -5,15 +5,24 @@ Extracts executable <run> blocks from LM responses.
 
 from __future__ import annotations
 
-import re
-
-
-_EXEC_BLOCK_RE = re.compile(
-    r"<run>\s*\n?(.*?)\n?\s*</run>",
-    re.DOTALL,
-)
+_OPEN = "<run>"
+_CLOSE = "</run>"
 
 
 def extract_executable(text: str) -> list[str]:
-    """Extract all executable <run> blocks from text."""
-    return _EXEC_BLOCK_RE.findall(text)
+    """Extract all executable <run> blocks from text.
+
+    Each block runs from a <run> to the first </run> after it, with
+    surrounding whitespace stripped. Scanned with str.find rather than a
+    lazy DOTALL regex, which rescans to the end of the text from every
+    unclosed <run>.
+    """
+    blocks = []
+    start = text.find(_OPEN)
+    while start != -1:
+        end = text.find(_CLOSE, start + len(_OPEN))
+        if end == -1:
+            break
+        blocks.append(text[start + len(_OPEN):end].strip())
+        start = text.find(_OPEN, end + len(_CLOSE))
+    return blocks
@@ -4,6 +4,7 @@ The Graph class discovers topology from Node type hints and handles execution.
 """
 
 import asyncio
+import functools
 import inspect
 import logging
 import types
@@ -15,7 +16,7 @@ from pydantic.fields import FieldInfo
 from bae.exceptions import BaeError, DepError, RecallError
 from bae.lm import LM
 from bae.markers import Effect
-from bae.node import Node, _has_ellipsis_body, _unwrap_annotated, _wants_lm
+from bae.node import Node, _call_hints, _has_ellipsis_body, _unwrap_annotated, _wants_lm
 from bae.resolver import LM_KEY, _engine_dep_cache, _get_base_type, classify_fields, resolve_fields, validate_node_deps
 from bae.result import GraphResult
 
@@ -27,14 +28,30 @@ logger = logging.getLogger(__name__)
 
 def _get_routing_strategy(
     node_cls: type[Node],
-) -> tuple[str, ...] | tuple[str, type] | tuple[str, list[type]]:
+) -> tuple[str, ...] | tuple[str, type] | tuple[str, tuple[type, ...]]:
+    """Routing strategy for a node class, computed once and stored on the class.
+
+    Read from the class's own __dict__ so a subclass never reuses its parent's
+    strategy. See _compute_routing_strategy for the possible values.
+    """
+    strategy = node_cls.__dict__.get("__bae_routing_strategy__")
+    if strategy is None:
+        strategy = _compute_routing_strategy(node_cls)
+        setattr(node_cls, "__bae_routing_strategy__", strategy)
+    return strategy
+
+
+def _compute_routing_strategy(
+    node_cls: type[Node],
+) -> tuple[str, ...] | tuple[str, type] | tuple[str, tuple[type, ...]]:
     """Determine the routing strategy for a node class.
 
     Returns:
         - ("custom",) - node has custom __call__ logic
         - ("terminal",) - node has ellipsis body with pure None return
         - ("make", target_type) - node has ellipsis body with single return type
-        - ("decide", types_list) - node has ellipsis body with union or optional return
+        - ("decide", types) - node has ellipsis body with union or optional return;
+          types is a tuple in declaration order, so the strategy is hashable
     """
     # Check if node has custom logic (non-ellipsis body)
     if not _has_ellipsis_body(node_cls.__call__):
@@ -54,12 +71,10 @@ def _get_routing_strategy(
     # Handle union types (X | Y | None)
     if isinstance(unwrapped, types.UnionType):
         args = get_args(unwrapped)
-        concrete_types = [
-            _unwrap_annotated(arg)
-            for arg in args
-            if arg is not type(None) and _unwrap_annotated(arg) is not type(None)
-        ]
-        concrete_types = [a for a in concrete_types if isinstance(a, type)]
+        concrete_types = tuple(
+            a for a in map(_unwrap_annotated, args)
+            if a is not type(None) and isinstance(a, type)
+        )
         is_optional = type(None) in args
 
         # No concrete types -> terminal
@@ -80,6 +95,21 @@ def _get_routing_strategy(
     return ("terminal",)
 
 
+@functools.lru_cache(maxsize=1024)
+def _plain_fields(node_cls: type[Node]) -> tuple[frozenset[str], frozenset[str]]:
+    """Plain model fields of a node class, and the required subset.
+
+    Graph.run checks these after every custom __call__; classifying the
+    fields resolves type hints, so it is done once per class.
+    """
+    model_fields = node_cls.model_fields
+    plain = frozenset(
+        n for n, k in classify_fields(node_cls).items()
+        if k == "plain" and n in model_fields
+    )
+    return plain, frozenset(n for n in plain if model_fields[n].is_required())
+
+
 def _get_effects(return_hint, target_type: type) -> list:
     """Extract Effect callables for a target type from a return hint."""
     def _collect(hint):
@@ -141,7 +171,21 @@ class Graph:
         self.start = start
         self._nodes: dict[type[Node], set[type[Node]]] = {}
         self._discover()
+        # Topology is fixed after discovery; materialize it once for repeated
+        # rendering by ns(graph). Edges are sorted by node name.
+        self._edges: tuple[tuple[type[Node], tuple[type[Node], ...]], ...] = tuple(
+            (n, tuple(sorted(self._nodes[n], key=lambda s: s.__name__)))
+            for n in sorted(self._nodes, key=lambda n: n.__name__)
+        )
+        self._terminals: frozenset[type[Node]] = frozenset(
+            n for n in self._nodes if n.is_terminal()
+        )
         self._validate_start()
+        # Routing depends only on each class's __call__; resolve it now, once
+        # every forward reference in the graph is defined, instead of on the
+        # first run step. (Not at class creation: successors may not exist yet.)
+        for node_cls in self._nodes:
+            _get_routing_strategy(node_cls)
 
     def _validate_start(self) -> None:
         """Validate start node and compute input field schema."""
@@ -190,28 +234,27 @@ class Graph:
     @property
     def terminal_nodes(self) -> set[type[Node]]:
         """Node types that can terminate the graph."""
-        return {n for n in self._nodes if n.is_terminal()}
+        return set(self._terminals)
 
     def validate(self) -> list[str]:
         """Validate graph structure. Returns list of warnings/errors."""
         issues = []
 
         # Check for nodes with no terminal path (would cause infinite loops)
-        nodes_with_terminal_path = set()
-        for node_cls in self._nodes:
-            if node_cls.is_terminal():
-                nodes_with_terminal_path.add(node_cls)
-
-        # Propagate backwards: if a node can reach a terminal, it has a terminal path
-        changed = True
-        while changed:
-            changed = False
-            for node_cls, successors in self._nodes.items():
-                if node_cls in nodes_with_terminal_path:
-                    continue
-                if any(s in nodes_with_terminal_path for s in successors):
-                    nodes_with_terminal_path.add(node_cls)
-                    changed = True
+        predecessors: dict[type[Node], list[type[Node]]] = {}
+        for node_cls, successors in self._nodes.items():
+            for s in successors:
+                predecessors.setdefault(s, []).append(node_cls)
+
+        # Walk edges backwards from the terminals, visiting each node once:
+        # if a node can reach a terminal, it has a terminal path
+        nodes_with_terminal_path = set(self._terminals)
+        queue = deque(self._terminals)
+        while queue:
+            for pred in predecessors.get(queue.popleft(), ()):
+                if pred not in nodes_with_terminal_path:
+                    nodes_with_terminal_path.add(pred)
+                    queue.append(pred)
 
         for node_cls in self._nodes:
             if node_cls not in nodes_with_terminal_path:
@@ -355,21 +398,12 @@ class Graph:
 
                     # Fill required plain fields the caller didn't set
                     if current is not None:
-                        model_fields = current.__class__.model_fields
-                        plain = {
-                            n for n, k in classify_fields(current.__class__).items()
-                            if k == "plain" and n in model_fields
-                        }
-                        unfilled = {
-                            n for n in plain
-                            if n not in (current.model_fields_set or set())
-                            and model_fields[n].is_required()
-                        }
-                        if unfilled:
+                        plain, required = _plain_fields(current.__class__)
+                        if not required <= current.model_fields_set:
                             target_resolved = await resolve_fields(
                                 current.__class__, trace, cache
                             )
-                            for name in plain & (current.model_fields_set or set()):
+                            for name in plain & current.model_fields_set:
                                 target_resolved[name] = getattr(current, name)
                             current = await lm.fill(
                                 current.__class__, target_resolved,
@@ -380,9 +414,7 @@ class Graph:
                     # Fire effects annotated on the return type hint
                     if current is not None:
                         source_cls = source_node.__class__
-                        raw_hint = get_type_hints(
-                            source_cls.__call__, include_extras=True
-                        ).get("return")
+                        raw_hint = _call_hints(source_cls.__call__).get("return")
                         if raw_hint:
                             for fn in _get_effects(raw_hint, current.__class__):
                                 result = fn(current)
@@ -417,9 +449,7 @@ class Graph:
                     )
 
                     # Fire effects annotated on the return type hint
-                    raw_hint = get_type_hints(
-                        source_cls.__call__, include_extras=True
-                    ).get("return")
+                    raw_hint = _call_hints(source_cls.__call__).get("return")
                     for fn in _get_effects(raw_hint, target_type):
                         result = fn(current)
                         if asyncio.iscoroutine(result):
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -134,12 +135,14 @@ T = TypeVar("T", bound="Node")
 
 
 
+@functools.lru_cache(maxsize=1024)
 def _build_plain_model(target_cls: type) -> type[BaseModel]:
     """Create a dynamic Pydantic model with only plain fields from target.
 
     Used to constrain LLM output to only the fields it should generate
     (not dep/recall fields). Preserves Field(description=...) metadata
     so descriptions flow into JSON schemas for constrained decoding.
+    Built once per target class: fill() and validate_plain_fields() share it.
     """
     fields = classify_fields(target_cls)
     hints = get_type_hints(target_cls, include_extras=True)
@@ -276,10 +279,13 @@ def _strip_format(schema: dict) -> dict:
     return out
 
 
-def _build_choice_schema(type_names: list[str]) -> dict:
+@functools.lru_cache(maxsize=256)
+def _build_choice_schema(type_names: tuple[str, ...]) -> dict:
     """Build a JSON schema for picking one of N type names.
 
     Uses a dynamic Pydantic model + transform_schema for constrained decoding.
+    The schema depends only on the names, so every decision offering the
+    same choices shares one -- callers must not mutate it.
     """
     ChoiceEnum = enum.Enum("ChoiceEnum", {n: n for n in type_names})
     ChoiceModel = create_model("Choice", choice=(ChoiceEnum, ...))
@@ -454,7 +460,7 @@ class ClaudeCLIBackend:
         if is_terminal:
             choice_prompt += "\n- None: Terminate processing"
 
-        choice_schema = _build_choice_schema(type_names)
+        choice_schema = _build_choice_schema(tuple(type_names))
 
         choice_data = await self._run_cli_json(choice_prompt, choice_schema)
         chosen = choice_data["choice"]
@@ -490,7 +496,7 @@ class ClaudeCLIBackend:
         )
         prompt = f"{context_json}\n\nPick one type: {', '.join(type_names)}"
 
-        choice_schema = _build_choice_schema(type_names)
+        choice_schema = _build_choice_schema(tuple(type_names))
 
         choice_data = await self._run_cli_json(prompt, choice_schema)
         chosen = choice_data["choice"]
@@ -11,7 +11,10 @@ Requires Python 3.14+ for PEP 649 (deferred annotation evaluation).
 from __future__ import annotations
 
 import ast
+import functools
 import inspect
+import linecache
+import os
 import textwrap
 import types
 from typing import Annotated, ClassVar, TypedDict, get_type_hints, get_args, get_origin
@@ -20,10 +23,68 @@ from pydantic import BaseModel, ConfigDict
 from bae.lm import LM
 
 
+def _may_be_ellipsis_body(method) -> bool:
+    """Cheap bytecode pre-check for _has_ellipsis_body.
+
+    `...`, `pass` and a bare docstring all compile to "return None", so the
+    code object can't confirm an ellipsis body -- but any global/attribute
+    name, extra local, closure or non-trivial constant rules one out without
+    reading the source.
+    """
+    code = getattr(inspect.unwrap(method), "__code__", None)
+    if code is None:
+        return True
+    n_args = code.co_argcount + code.co_kwonlyargcount
+    if code.co_flags & inspect.CO_VARARGS:
+        n_args += 1
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        n_args += 1
+    if code.co_names or code.co_freevars or code.co_cellvars or code.co_nlocals > n_args:
+        return False
+    # Strings cover the docstring; the AST check decides anything left.
+    return all(c is None or c is ... or isinstance(c, str) for c in code.co_consts)
+
+
+@functools.lru_cache(maxsize=64)
+def _source_function_defs(
+    filename: str, mtime_ns: int,
+) -> dict[int, ast.FunctionDef | ast.AsyncFunctionDef]:
+    """Function definitions in a source file, keyed by their co_firstlineno.
+
+    Parsed once per file version, so all the Node methods of a module
+    share one parse.
+    """
+    linecache.checkcache(filename)
+    try:
+        tree = ast.parse("".join(linecache.getlines(filename)))
+    except (SyntaxError, ValueError):
+        return {}
+    return {
+        (node.decorator_list[0].lineno if node.decorator_list else node.lineno): node
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+
+def _function_def(method) -> ast.FunctionDef | ast.AsyncFunctionDef | None:
+    """Locate a function's definition node in the parsed AST of its source file."""
+    code = getattr(inspect.unwrap(method), "__code__", None)
+    if code is None:
+        return None
+    try:
+        mtime_ns = os.stat(code.co_filename).st_mtime_ns
+    except OSError:
+        return None
+    return _source_function_defs(code.co_filename, mtime_ns).get(code.co_firstlineno)
+
+
+@functools.lru_cache(maxsize=1024)
 def _has_ellipsis_body(method) -> bool:
     """Check if a method body consists only of `...` (Ellipsis).
 
-    This signals "use automatic routing" vs custom logic.
+    This signals "use automatic routing" vs custom logic. Memoized per
+    function object; the AST comes from a per-file parse, falling back to
+    the method's own source when its file can't be read.
 
     Args:
         method: A method (function) to inspect.
@@ -31,22 +92,25 @@ def _has_ellipsis_body(method) -> bool:
     Returns:
         True if body is just `...`, False otherwise.
     """
-    try:
-        source = inspect.getsource(method)
-        source = textwrap.dedent(source)
-        tree = ast.parse(source)
-    except (OSError, TypeError, SyntaxError, IndentationError):
+    if not _may_be_ellipsis_body(method):
         return False
-
-    # Find the function definition
-    func_def = None
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_def = node
-            break
-
+    func_def = _function_def(method)
     if func_def is None:
-        return False
+        try:
+            source = inspect.getsource(method)
+            source = textwrap.dedent(source)
+            tree = ast.parse(source)
+        except (OSError, TypeError, SyntaxError, IndentationError):
+            return False
+
+        # Find the function definition
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                func_def = node
+                break
+
+        if func_def is None:
+            return False
 
     # Check if body is just `...` (with optional docstring)
     # Body can be: [Ellipsis] or [docstring, Ellipsis]
@@ -124,6 +188,26 @@ def _hint_includes_none(hint) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=1024)
+def _call_hints(method) -> types.MappingProxyType:
+    """get_type_hints(method, include_extras=True), resolved once per function.
+
+    Read-only because the mapping is shared by every caller.
+    """
+    return types.MappingProxyType(get_type_hints(method, include_extras=True))
+
+
+@functools.lru_cache(maxsize=1024)
+def _return_hint(method):
+    """Return annotation of a method (Annotated stripped), resolved once per function.
+
+    Keyed on the function, so every class that inherits the same __call__
+    -- Node.__call__ included -- shares a single lookup.
+    """
+    return get_type_hints(method).get("return")
+
+
+@functools.lru_cache(maxsize=1024)
 def _wants_lm(method) -> bool:
     """Check if __call__ has a parameter type-hinted as LM protocol.
 
@@ -209,11 +293,9 @@ class Node(BaseModel):
     @classmethod
     def successors(cls) -> set[type[Node]]:
         """Get node types that can follow this node (from return type hint)."""
-        hints = get_type_hints(cls.__call__)
-        return _extract_types_from_hint(hints.get("return"))
+        return _extract_types_from_hint(_return_hint(cls.__call__))
 
     @classmethod
     def is_terminal(cls) -> bool:
         """Check if this node type can be terminal (return None)."""
-        hints = get_type_hints(cls.__call__)
-        return _hint_includes_none(hints.get("return"))
+        return _hint_includes_none(_return_hint(cls.__call__))
@@ -375,6 +375,29 @@ _TOOL_HUMAN_NAMES = {"R": "read", "W": "write", "E": "edit", "G": "glob", "Grep"
 
 _ERROR_OUTPUT_RE = re.compile(r"^[A-Z][a-zA-Z]*Error:")
 
+_SUMMARY_TAG_RE = re.compile(r"<(\w+):(.+?)>")
+
+
+def _read_hint(output: str) -> str:
+    n = output.count("\n") + 1 if output else 0
+    return f"{n} lines"
+
+
+def _match_hint(output: str) -> str:
+    # len(output.splitlines()) for newline-separated text, without building the list
+    if not output or output == "(no matches)":
+        return "0 matches"
+    n = output.count("\n") + (not output.endswith("\n"))
+    return f"{n} matches"
+
+
+# Count hint shown after a successful tool call's return type, by tool type
+_SUMMARY_HINTS = {
+    "R": _read_hint,
+    "G": _match_hint,
+    "Grep": _match_hint,
+}
+
 
 def _is_error_output(output: str) -> bool:
     """Check if output starts with a PascalCase error type name followed by ':'."""
@@ -393,7 +416,7 @@ def _tool_summary(tag: str, output: str, *, is_error: bool = False, resource: st
       [source] ◆ read(bae.repl.ai) -> str (42 lines)
       ◆ read(nonexistent) -> ResourceError
     """
-    m = re.match(r"<(\w+):(.+?)>", tag.strip())
+    m = _SUMMARY_TAG_RE.match(tag.strip())
     if not m:
         return output
     tool_type = _TOOL_NAMES.get(m.group(1).lower(), m.group(1))
@@ -402,20 +425,14 @@ def _tool_summary(tag: str, output: str, *, is_error: bool = False, resource: st
     name = _TOOL_HUMAN_NAMES.get(tool_type, tool_type)
 
     # Determine return type and count hint
-    if is_error or _is_error_output(output):
-        return_type = _error_type_name(output) if _is_error_output(output) else "Error"
+    error_output = _is_error_output(output)
+    if is_error or error_output:
+        return_type = _error_type_name(output) if error_output else "Error"
         hint = ""
     else:
         return_type = "str"
-        if tool_type == "R":
-            n = output.count("\n") + 1 if output else 0
-            hint = f"{n} lines"
-        elif tool_type in ("G", "Grep"):
-            lines = output.splitlines()
-            n = len(lines) if output and output != "(no matches)" else 0
-            hint = f"{n} matches"
-        else:
-            hint = ""
+        hint_fn = _SUMMARY_HINTS.get(tool_type)
+        hint = hint_fn(output) if hint_fn else ""
 
     suffix = f" ({hint})" if hint else ""
     prefix = f"[{resource}] " if resource else ""
@@ -556,9 +573,8 @@ def _build_context(namespace: dict) -> str:
     if isinstance(graph, Graph):
         lines.append(f">>> ns(graph)")
         lines.append(f"Graph(start={graph.start.__name__})")
-        lines.append(f"  Nodes: {len(graph.nodes)}")
-        for n in sorted(graph.nodes, key=lambda x: x.__name__):
-            succs = graph.edges.get(n, set())
+        lines.append(f"  Nodes: {len(graph._edges)}")
+        for n, succs in graph._edges:
             target = ", ".join(s.__name__ for s in succs) if succs else "(terminal)"
             lines.append(f"    {n.__name__} -> {target}")
 
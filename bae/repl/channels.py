@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from collections import deque
 from dataclasses import dataclass, field
 from io import StringIO
 from pathlib import Path
@@ -26,6 +27,17 @@ CHANNEL_DEFAULTS = {
     "debug": {"color": "#808080"},
 }
 
+# CHANNEL_DEFAULTS flattened to (name, color, markdown) once at import.
+# Channels themselves are per-router (visibility, buffer), so only the specs
+# are shared.
+_DEFAULT_CHANNEL_SPECS = tuple(
+    (name, cfg["color"], cfg.get("markdown", False)) for name, cfg in CHANNEL_DEFAULTS.items()
+)
+
+# Per-channel scrollback cap: deep enough for inspection, bounded so long
+# sessions and graph stress don't grow the buffer without limit.
+BUFFER_MAXLEN = 4096
+
 
 def render_markdown(text: str, width: int | None = None) -> str:
     """Convert markdown text to ANSI-escaped string via Rich."""
@@ -71,7 +83,9 @@ class Channel:
     markdown: bool = False
     store: SessionStore | None = None
     _formatter: ViewFormatter | None = field(default=None, repr=False)
-    _buffer: list[str] = field(default_factory=list, repr=False)
+    _buffer: deque[str] = field(
+        default_factory=lambda: deque(maxlen=BUFFER_MAXLEN), repr=False,
+    )
 
     @property
     def label(self) -> str:
@@ -145,6 +159,22 @@ class ChannelRouter:
         self._channels[name] = ch
         return ch
 
+    def register_defaults(
+        self, defaults: dict[str, dict] = CHANNEL_DEFAULTS, store: SessionStore | None = None,
+    ) -> None:
+        """Register every channel in a name -> {color, markdown} table in one pass."""
+        overlap = self._channels.keys() & defaults.keys()
+        if overlap:
+            raise ValueError(f"Channels already registered: {', '.join(sorted(overlap))}")
+        if defaults is CHANNEL_DEFAULTS:
+            specs = _DEFAULT_CHANNEL_SPECS
+        else:
+            specs = [(n, cfg["color"], cfg.get("markdown", False)) for n, cfg in defaults.items()]
+        self._channels.update({
+            name: Channel(name=name, color=color, markdown=markdown, store=store)
+            for name, color, markdown in specs
+        })
+
     def write(self, channel: str, content: str, **kwargs) -> None:
         """Write to a named channel. No-op for unknown channels."""
         ch = self._channels.get(channel)
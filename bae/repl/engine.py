@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import contextvars
 import enum
+import heapq
 import logging
 import resource
 import sys
@@ -46,6 +47,7 @@ if TYPE_CHECKING:
 
 
 class GraphState(enum.Enum):
+    QUEUED = "queued"
     RUNNING = "running"
     WAITING = "waiting"
     DONE = "done"
@@ -88,12 +90,14 @@ class GraphRun:
     node_timings: list[NodeTiming] = field(default_factory=list)
     current_node: str = ""
     started_ns: int = field(default_factory=time.perf_counter_ns)
+    admitted_ns: int = 0
     ended_ns: int = 0
     error: str = ""
     result: GraphResult | None = None
     dep_timings: list[tuple[str, float]] = field(default_factory=list)
     rss_delta_bytes: int = 0
     policy: OutputPolicy = OutputPolicy.NORMAL
+    priority: int = 0
     _done: asyncio.Event = field(default_factory=asyncio.Event)
 
 
@@ -136,6 +140,10 @@ class TimingLM:
     def __init__(self, inner: LM, run: GraphRun):
         self._inner = inner
         self._run = run
+        # Untimed calls pass straight through: bind the inner methods directly
+        # rather than wrapping each call in another coroutine frame.
+        self.choose_type = inner.choose_type
+        self.decide = inner.decide
 
     async def _timed(self, method, *args, node_name, **kwargs):
         start = time.perf_counter_ns()
@@ -153,25 +161,30 @@ class TimingLM:
             node_name=target.__name__,
         )
 
-    async def choose_type(self, types, context):
-        return await self._inner.choose_type(types, context)
-
     async def make(self, node, target):
         return await self._timed(
             self._inner.make, node, target, node_name=target.__name__,
         )
 
-    async def decide(self, node):
-        return await self._inner.decide(node)
-
 
 class GraphRegistry:
-    def __init__(self):
+    """Tracks graph runs and admits them to execution.
+
+    With max_concurrent set, runs beyond the cap wait in an admission queue
+    ordered by aged priority: priority + aging_per_s * seconds queued.
+    """
+
+    def __init__(self, *, max_concurrent: int | None = None, aging_per_s: float = 1.0):
         self._runs: dict[str, GraphRun] = {}
         self._next_id: int = 1
         self._completed: deque[GraphRun] = deque(maxlen=20)
         self._pending_gates: dict[str, InputGate] = {}
         self._gate_counters: dict[str, int] = {}  # per-graph gate counter
+        self._max_concurrent = max_concurrent
+        self._aging_per_s = aging_per_s
+        self._admitted: int = 0
+        self._admit_queue: list[tuple[float, int, asyncio.Future]] = []
+        self._admit_seq: int = 0
 
     def submit(
         self,
@@ -181,15 +194,66 @@ class GraphRegistry:
         lm: LM | None = None,
         notify=None,
         policy: OutputPolicy = OutputPolicy.NORMAL,
+        priority: int = 0,
         **kwargs,
     ) -> GraphRun:
-        run_id = f"g{self._next_id}"
-        self._next_id += 1
-        run = GraphRun(run_id=run_id, graph=graph, policy=policy)
-        self._runs[run_id] = run
-        coro = self._execute(run, lm=lm, notify=notify, policy=policy, **kwargs)
-        tm.submit(coro, name=f"graph:{run_id}:{graph.start.__name__}", mode="graph")
-        return run
+        return self.submit_many(
+            graph, tm, [kwargs], lm=lm, notify=notify, policy=policy, priority=priority,
+        )[0]
+
+    def submit_many(
+        self,
+        graph: Graph,
+        tm: TaskManager,
+        inputs: list[dict],
+        *,
+        lm: LM | None = None,
+        notify=None,
+        policy: OutputPolicy = OutputPolicy.NORMAL,
+        priority: int = 0,
+    ) -> list[GraphRun]:
+        """Submit one run of graph per input dict, sharing lm/notify/policy.
+
+        Run ids are allocated as a single block before any task is spawned.
+        """
+        first_id = self._next_id
+        self._next_id += len(inputs)
+        name = graph.start.__name__
+        runs = [
+            GraphRun(
+                run_id=f"g{first_id + i}", graph=graph, policy=policy, priority=priority,
+            )
+            for i in range(len(inputs))
+        ]
+        self._runs.update((run.run_id, run) for run in runs)
+        for run, kwargs in zip(runs, inputs):
+            coro = self._execute(run, lm=lm, notify=notify, policy=policy, **kwargs)
+            tm.submit(coro, name=f"graph:{run.run_id}:{name}", mode="graph")
+        return runs
+
+    async def submit_group(
+        self,
+        graph: Graph,
+        tm: TaskManager,
+        inputs: list[dict],
+        *,
+        lm: LM | None = None,
+        notify=None,
+        policy: OutputPolicy = OutputPolicy.NORMAL,
+        priority: int = 0,
+    ) -> list[GraphRun]:
+        """Submit a batch via submit_many and return once every run has finished.
+
+        Runs stay tracked (and revocable) through the TaskManager; the group only
+        waits on their completion events, so failures are reported per run.
+        """
+        runs = self.submit_many(
+            graph, tm, inputs, lm=lm, notify=notify, policy=policy, priority=priority,
+        )
+        async with asyncio.TaskGroup() as tg:
+            for run in runs:
+                tg.create_task(run._done.wait())
+        return runs
 
     def _make_gate_hook(self, run: GraphRun, notify=None):
         """Build a gate hook closure for a specific graph run."""
@@ -230,12 +294,14 @@ class GraphRegistry:
             log_handler = _NotifyHandler(run.run_id, notify)
             _graph_logger.addHandler(log_handler)
 
-        _emit("start", f"{run.run_id} started", {
-            "type": "lifecycle", "event": "start", "run_id": run.run_id,
-        })
-        rss_before = _get_rss_bytes()
-
+        admitted = False
         try:
+            await self._admit(run)
+            admitted = True
+            _emit("start", f"{run.run_id} started", {
+                "type": "lifecycle", "event": "start", "run_id": run.run_id,
+            })
+            rss_before = _get_rss_bytes()
             yield _dep_timing_hook
             rss_after = _get_rss_bytes()
             run.rss_delta_bytes = rss_after - rss_before
@@ -264,6 +330,8 @@ class GraphRegistry:
         finally:
             if log_handler:
                 _graph_logger.removeHandler(log_handler)
+            if admitted:
+                self._release()
             run.ended_ns = time.perf_counter_ns()
             self._archive(run)
 
@@ -300,6 +368,7 @@ class GraphRegistry:
         name: str = "graph",
         notify=None,
         policy: OutputPolicy = OutputPolicy.NORMAL,
+        priority: int = 0,
     ) -> GraphRun:
         """Submit a pre-built coroutine as a managed graph run.
 
@@ -308,7 +377,7 @@ class GraphRegistry:
         """
         run_id = f"g{self._next_id}"
         self._next_id += 1
-        run = GraphRun(run_id=run_id, graph=None, policy=policy)
+        run = GraphRun(run_id=run_id, graph=None, policy=policy, priority=priority)
         self._runs[run_id] = run
         wrapped = self._wrap_coro(run, coro, notify=notify, policy=policy)
         tm.submit(wrapped, name=f"graph:{run_id}:{name}", mode="graph")
@@ -336,6 +405,42 @@ class GraphRegistry:
         finally:
             _engine_dep_cache.reset(token)
 
+    # ── Admission ────────────────────────────────────────────────────────
+
+    async def _admit(self, run: GraphRun) -> None:
+        """Take an execution slot, queueing behind the cap when it is full.
+
+        Aging is uniform across waiters, so the aged priority ordering equals
+        ordering by (aging_per_s * enqueue_s - priority) -- a static heap key.
+        """
+        cap = self._max_concurrent
+        if not self._admit_queue and (cap is None or self._admitted < cap):
+            self._admitted += 1
+            run.admitted_ns = time.perf_counter_ns()
+            return
+        run.state = GraphState.QUEUED
+        fut = asyncio.get_running_loop().create_future()
+        key = self._aging_per_s * time.perf_counter_ns() / 1e9 - run.priority
+        heapq.heappush(self._admit_queue, (key, self._admit_seq, fut))
+        self._admit_seq += 1
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self._release()  # slot was handed over just before cancel
+            raise
+        run.state = GraphState.RUNNING
+        run.admitted_ns = time.perf_counter_ns()
+
+    def _release(self) -> None:
+        """Hand the slot to the best queued waiter, or free it."""
+        while self._admit_queue:
+            _, _, fut = heapq.heappop(self._admit_queue)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._admitted -= 1
+
     def _archive(self, run: GraphRun) -> None:
         self._runs.pop(run.run_id, None)
         self._completed.append(run)
@@ -399,7 +504,7 @@ class GraphRegistry:
     def active(self) -> list[GraphRun]:
         return [
             r for r in self._runs.values()
-            if r.state in (GraphState.RUNNING, GraphState.WAITING)
+            if r.state in (GraphState.QUEUED, GraphState.RUNNING, GraphState.WAITING)
         ]
 
     def get(self, run_id: str) -> GraphRun | None:
@@ -7,16 +7,17 @@ NsInspector provides ns() for listing and ns(obj) for deep inspection.
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import os
 import textwrap
-from typing import Annotated, get_args, get_origin, get_type_hints
+from typing import Annotated, get_args, get_origin
 
 import bae
 from bae.graph import Graph
 from bae.markers import Dep
 from bae.node import Node
-from bae.resolver import classify_fields
+from bae.resolver import _class_hints, classify_fields
 
 
 # Objects pre-loaded into the REPL namespace.
@@ -33,22 +34,30 @@ _PRELOADED = {
     "os": os,
 }
 
+# seed() copies this; only the NsInspector is built per namespace.
+_SEED_BASE = {"__builtins__": __builtins__, **_PRELOADED}
+
 
 def seed() -> dict:
     """Build the initial REPL namespace with bae objects pre-loaded."""
-    ns: dict = {"__builtins__": __builtins__}
-    ns.update(_PRELOADED)
+    ns = _SEED_BASE.copy()
     ns["ns"] = NsInspector(ns)
     return ns
 
 
+@functools.lru_cache(maxsize=512)
+def _first_doc_line(doc: str) -> str:
+    """First line of a docstring, memoized on the docstring text itself."""
+    return doc.strip().splitlines()[0]
+
+
 def _one_liner(obj: object) -> str:
     """One-line summary for namespace listing."""
     if isinstance(obj, NsInspector):
         return "ns() -- inspect namespace"
     if isinstance(obj, type):
         if obj.__doc__:
-            return obj.__doc__.strip().splitlines()[0]
+            return _first_doc_line(obj.__doc__)
         return obj.__name__
     if inspect.ismodule(obj):
         return obj.__name__
@@ -57,6 +66,13 @@ def _one_liner(obj: object) -> str:
     return textwrap.shorten(repr(obj), width=60)
 
 
+def _stable_summary(obj: object) -> bool:
+    """True when _one_liner(obj) depends only on the object's identity, not its state."""
+    if isinstance(obj, (type, NsInspector)) or inspect.ismodule(obj):
+        return True
+    return callable(obj) and getattr(obj, "__qualname__", None) is not None
+
+
 class NsInspector:
     """Namespace introspection tool.
 
@@ -68,6 +84,8 @@ class NsInspector:
 
     def __init__(self, namespace: dict) -> None:
         self._ns = namespace
+        # (visible (name, obj) pairs, rendered table) from the last cacheable ns()
+        self._listing: tuple[list[tuple[str, object]], str] | None = None
 
     def __call__(self, obj=None):
         if obj is None:
@@ -85,11 +103,22 @@ class NsInspector:
         return "ns() -- inspect namespace. ns(obj) -- inspect object."
 
     def _list_all(self):
-        """Print column-aligned table of all non-underscore namespace entries."""
+        """Print column-aligned table of all non-underscore namespace entries.
+
+        The rendered table is reused while every visible name is bound to the
+        same object, unless some entry's summary comes from its (mutable) repr.
+        """
+        visible = sorted((n, o) for n, o in self._ns.items() if not n.startswith("_"))
+        if self._listing is not None:
+            prev, output = self._listing
+            if len(prev) == len(visible) and all(
+                pn == n and po is o for (pn, po), (n, o) in zip(prev, visible)
+            ):
+                print(output)
+                return
+
         items = []
-        for name, obj in sorted(self._ns.items()):
-            if name.startswith("_"):
-                continue
+        for name, obj in visible:
             if isinstance(obj, type):
                 type_label = "class"
             else:
@@ -103,29 +132,34 @@ class NsInspector:
 
         max_name = max(len(i[0]) for i in items)
         max_type = max(len(i[1]) for i in items)
-        for name, type_label, summary in items:
-            print(f"  {name:<{max_name}}  {type_label:<{max_type}}  {summary}")
+        output = "\n".join(
+            f"  {name:<{max_name}}  {type_label:<{max_type}}  {summary}"
+            for name, type_label, summary in items
+        )
+        print(output)
+        if all(_stable_summary(obj) for _, obj in visible):
+            self._listing = (visible, output)
+        else:
+            self._listing = None
 
     def _inspect_graph(self, graph: Graph):
         """Print graph topology: start, nodes, edges, terminals."""
         print(f"Graph(start={graph.start.__name__})")
-        print(f"  Nodes: {len(graph.nodes)}")
-        for node_cls in sorted(graph.nodes, key=lambda n: n.__name__):
-            succs = graph.edges.get(node_cls, set())
+        print(f"  Nodes: {len(graph._edges)}")
+        for node_cls, succs in graph._edges:
             if succs:
-                succ_str = ", ".join(sorted(s.__name__ for s in succs))
+                succ_str = ", ".join(s.__name__ for s in succs)
             else:
                 succ_str = "(terminal)"
             print(f"    {node_cls.__name__} -> {succ_str}")
-        terminals = graph.terminal_nodes
-        if terminals:
-            print(f"  Terminals: {', '.join(sorted(n.__name__ for n in terminals))}")
+        if graph._terminals:
+            print(f"  Terminals: {', '.join(sorted(n.__name__ for n in graph._terminals))}")
 
     def _inspect_node_class(self, node_cls: type[Node]):
         """Print node class fields with type, kind, and annotations."""
         print(f"{node_cls.__name__}(Node)")
         if node_cls.__doc__:
-            print(f"  {node_cls.__doc__.strip().splitlines()[0]}")
+            print(f"  {_first_doc_line(node_cls.__doc__)}")
 
         succs = node_cls.successors()
         if succs:
@@ -137,7 +171,7 @@ class NsInspector:
         if model_fields:
             print("  Fields:")
             max_name = max(len(n) for n in model_fields)
-            hints = get_type_hints(node_cls, include_extras=True)
+            hints = _class_hints(node_cls)
             for name in model_fields:
                 kind = fields.get(name, "plain")
                 # Extract base type from Annotated if needed
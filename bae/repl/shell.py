@@ -23,7 +23,7 @@ from pygments.lexers.python import PythonLexer
 from bae.repl.ai import AI
 from bae.repl.bash import dispatch_bash
 from bae.repl.engine import GraphRegistry
-from bae.repl.channels import CHANNEL_DEFAULTS, ChannelRouter, toggle_channels
+from bae.repl.channels import ChannelRouter, toggle_channels
 from bae.repl.rooms import ResourceRegistry, ResourceHandle
 from bae.repl.rooms.source import SourceRoom
 from bae.repl.rooms.tasks import TaskRoom
@@ -219,10 +219,7 @@ class CortexShell:
         self.store = SessionStore(Path.cwd() / ".bae" / "store.db")
         self.namespace["store"] = self.store
         self.router = ChannelRouter()
-        for name, cfg in CHANNEL_DEFAULTS.items():
-            self.router.register(
-                name, cfg["color"], store=self.store, markdown=cfg.get("markdown", False)
-            )
+        self.router.register_defaults(store=self.store)
         self.namespace["channels"] = self.router
         self.view_mode = ViewMode.USER
         self._set_view(ViewMode.USER)
@@ -251,8 +248,8 @@ class CortexShell:
         self.namespace["ai"] = self.ai
         self.namespace["engine"] = self.engine
         self.toolbar = ToolbarConfig()
-        self.toolbar.add("mode", make_mode_widget(self))
-        self.toolbar.add("view", make_view_widget(self))
+        self.toolbar.add("mode", make_mode_widget(self), key_fn=lambda: self.mode)
+        self.toolbar.add("view", make_view_widget(self), key_fn=lambda: self.view_mode)
         self.toolbar.add("tasks", make_tasks_widget(self))
         self.toolbar.add("gates", make_gates_widget(self))
         self.toolbar.add("location", make_location_widget(self))
@@ -7,6 +7,7 @@ import sqlite3
 import time
 import uuid
 from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
 
 MAX_CONTENT = 10_000
 
@@ -50,16 +51,107 @@ CREATE INDEX IF NOT EXISTS idx_entries_channel ON entries(channel);
 CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries(timestamp);
 """
 
+INSERT_ENTRY = (
+    "INSERT INTO entries(session_id, timestamp, mode, channel, direction, content, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+# One shared connection per database file for SessionStore.from_pool()
+_STORE_POOL: dict[Path, sqlite3.Connection] = {}
+
+
+def _is_memory_uri(uri: str) -> bool:
+    """Whether a file: URI names an in-memory database (file::memory: or mode=memory)."""
+    parts = urlsplit(uri)
+    return parts.path == ":memory:" or parse_qs(parts.query).get("mode") == ["memory"]
+
+
+def close_pool(db_path: Path | None = None) -> None:
+    """Close pooled connections: the one for db_path, or all of them."""
+    paths = [Path(db_path).resolve()] if db_path is not None else list(_STORE_POOL)
+    for path in paths:
+        conn = _STORE_POOL.pop(path, None)
+        if conn is not None:
+            conn.close()
+
 
 class SessionStore:
-    """SQLite persistence for REPL I/O."""
+    """SQLite persistence for REPL I/O.
+
+    db_path is a file path, ":memory:", or a "file:..." URI. Only ":memory:",
+    file::memory: and mode=memory URIs are in-memory (tests, throwaway
+    sessions); every other path or URI is an on-disk database.
+    """
 
-    def __init__(self, db_path: Path) -> None:
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(db_path))
+    _pooled = False
+
+    def __init__(self, db_path: Path | str) -> None:
+        uri = isinstance(db_path, str) and db_path.startswith("file:")
+        in_memory = db_path == ":memory:" or (uri and _is_memory_uri(db_path))
+        if in_memory:
+            self._conn = sqlite3.connect(db_path, uri=True)
+        elif uri:
+            path = unquote(urlsplit(db_path).path)
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, uri=True)
+        else:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path))
         self._conn.row_factory = sqlite3.Row
-        self._conn.executescript(SCHEMA)
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        if in_memory:
+            # In-memory databases vanish with the connection, so there is
+            # nothing to make durable: keep the journal in RAM and skip syncs.
+            # Never applied to on-disk databases, file: URIs included.
+            self._conn.execute("PRAGMA journal_mode=MEMORY")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+        else:
+            # WAL with NORMAL sync stays corruption-safe and drops the fsync
+            # per commit that FULL pays on every record().
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema(self._conn)
+        self._start_session()
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection) -> SessionStore:
+        """Start a session on an open connection whose schema is already in place.
+
+        Skips the DDL, e.g. for a connection cloned via backup() from a
+        template database. Connection pragmas are left to the caller.
+        """
+        store = cls.__new__(cls)
+        store._conn = conn
+        store._conn.row_factory = sqlite3.Row
+        store._start_session()
+        return store
+
+    @classmethod
+    def from_pool(cls, db_path: Path) -> SessionStore:
+        """Start a session on the pooled connection for db_path.
+
+        The first store for a file opens and initialises it; later ones only
+        add a session row. close() on a pooled store rolls back and leaves the
+        connection open for the next one -- close_pool() really closes it.
+        """
+        path = Path(db_path).resolve()
+        conn = _STORE_POOL.get(path)
+        if conn is None:
+            store = cls(path)
+            _STORE_POOL[path] = store._conn
+        else:
+            store = cls.from_connection(conn)
+        store._pooled = True
+        return store
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """Create tables, FTS index and triggers if they don't exist yet."""
+        conn.executescript(SCHEMA)
+
+    def _start_session(self) -> None:
+        """Register a new session row and make it the current session."""
         self.session_id = str(uuid.uuid7())
         self._conn.execute(
             "INSERT INTO sessions(id, started_at, cwd) VALUES (?, ?, ?)",
@@ -76,17 +168,35 @@ class SessionStore:
         metadata: dict | None = None,
     ) -> None:
         """Persist a single I/O entry."""
+        self._conn.execute(
+            INSERT_ENTRY, self._entry_row(mode, channel, direction, content, metadata),
+        )
+        self._conn.commit()
+
+    def record_many(self, rows: list[tuple]) -> None:
+        """Persist several entries in one transaction.
+
+        Each row is (mode, channel, direction, content) with an optional
+        trailing metadata dict, as for record().
+        """
+        with self._conn:
+            self._conn.executemany(INSERT_ENTRY, [self._entry_row(*row) for row in rows])
+
+    def _entry_row(
+        self,
+        mode: str,
+        channel: str,
+        direction: str,
+        content: str,
+        metadata: dict | None = None,
+    ) -> tuple:
+        """Build the entries INSERT parameters, truncating oversized content."""
         meta = dict(metadata) if metadata else {}
         if len(content) > MAX_CONTENT:
             meta["truncated"] = True
             meta["original_length"] = len(content)
             content = content[:MAX_CONTENT]
-        self._conn.execute(
-            "INSERT INTO entries(session_id, timestamp, mode, channel, direction, content, metadata) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (self.session_id, time.time(), mode, channel, direction, content, json.dumps(meta)),
-        )
-        self._conn.commit()
+        return (self.session_id, time.time(), mode, channel, direction, content, json.dumps(meta))
 
     def search(self, query: str, limit: int = 20) -> list[dict]:
         """Full-text search across all entries."""
@@ -105,11 +215,18 @@ class SessionStore:
         ).fetchall()
         return [dict(row) for row in rows]
 
-    def session_entries(self, session_id: str | None = None) -> list[dict]:
-        """All entries for a session (default: current)."""
+    def session_entries(
+        self, session_id: str | None = None, *, parse_metadata: bool = False,
+    ) -> list[dict]:
+        """All entries for a session (default: current).
+
+        parse_metadata adds a metadata_type key, extracted from the JSON
+        metadata by SQLite (None when the entry has no type).
+        """
         sid = session_id or self.session_id
+        columns = "*, json_extract(metadata, '$.type') AS metadata_type" if parse_metadata else "*"
         rows = self._conn.execute(
-            "SELECT * FROM entries WHERE session_id = ? ORDER BY timestamp",
+            f"SELECT {columns} FROM entries WHERE session_id = ? ORDER BY timestamp",
             (sid,),
         ).fetchall()
         return [dict(row) for row in rows]
@@ -124,7 +241,9 @@ class SessionStore:
     def _format_entry(self, entry: dict, max_width: int = 80) -> str:
         """Format an entry for display with canonical [mode:channel:direction] tag."""
         tag = f"[{entry['mode']}:{entry['channel']}:{entry['direction']}]"
-        content = entry["content"].replace("\n", "\\n")
+        # Escaping only lengthens text, so a max_width-char prefix is all that
+        # can ever be shown -- don't escape up to MAX_CONTENT chars to drop them.
+        content = entry["content"][:max_width].replace("\n", "\\n")
         avail = max_width - len(tag) - 1  # 1 for space
         if len(content) > avail:
             content = content[:avail - 3] + "..."
@@ -158,5 +277,8 @@ class SessionStore:
         return result[:budget]
 
     def close(self) -> None:
-        """Close the database connection."""
-        self._conn.close()
+        """Close the database connection (pooled stores only roll back)."""
+        if self._pooled:
+            self._conn.rollback()
+        else:
+            self._conn.close()
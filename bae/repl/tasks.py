@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import enum
 import os
 import signal
@@ -26,6 +27,12 @@ class TrackedTask:
     process: asyncio.subprocess.Process | None = None
 
 
+# The TrackedTask whose coroutine is running, set in each task's own context.
+_current_tt: contextvars.ContextVar[TrackedTask | None] = contextvars.ContextVar(
+    "current_tracked_task", default=None,
+)
+
+
 class TaskManager:
     def __init__(self) -> None:
         self._tasks: dict[int, TrackedTask] = {}
@@ -33,18 +40,34 @@ class TaskManager:
         self._next_id = 1
 
     def submit(self, coro, *, name: str, mode: str) -> TrackedTask:
-        task = asyncio.create_task(coro, name=name)
-        tt = TrackedTask(task=task, name=name, mode=mode, task_id=self._next_id)
-        self._tasks[self._next_id] = tt
-        self._by_asyncio_task[task] = tt
-        self._next_id += 1
-        task.add_done_callback(self._on_done)
-        return tt
+        return self.submit_many([(coro, name, mode)])[0]
+
+    def submit_many(self, items: list[tuple]) -> list[TrackedTask]:
+        """Track several (coro, name, mode) tasks with consecutive ids in one pass.
+
+        Each task is registered as soon as it is created, so if a later item
+        fails to start, the ones already running stay reachable by revoke().
+        """
+        tracked = []
+        for coro, name, mode in items:
+            ctx = contextvars.copy_context()
+            task = asyncio.create_task(coro, name=name, context=ctx)
+            tt = TrackedTask(task=task, name=name, mode=mode, task_id=self._next_id)
+            self._next_id += 1
+            # The task hasn't started yet, so its context can still be entered here.
+            ctx.run(_current_tt.set, tt)
+            self._tasks[tt.task_id] = tt
+            self._by_asyncio_task[task] = tt
+            task.add_done_callback(self._on_done)
+            tracked.append(tt)
+        return tracked
 
     def register_process(self, process: asyncio.subprocess.Process) -> None:
-        current = asyncio.current_task()
-        tt = self._by_asyncio_task.get(current)
-        if tt is not None:
+        tt = _current_tt.get()
+        # Child tasks inherit the context; only the tracked task itself counts.
+        if tt is None or tt.task is not asyncio.current_task():
+            return
+        if self._tasks.get(tt.task_id) is tt:
             tt.process = process
 
     def revoke(self, task_id: int, *, graceful: bool = True) -> None:
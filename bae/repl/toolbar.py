@@ -7,10 +7,12 @@ render_task_menu() provides the numbered task list for the inline kill menu.
 
 from __future__ import annotations
 
+import functools
 import os
 import resource
 import sys
-from typing import TYPE_CHECKING, Callable
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from bae.repl.tasks import TaskManager
@@ -19,6 +21,9 @@ ToolbarWidget = Callable[[], list[tuple[str, str]]]
 
 TASKS_PER_PAGE = 5
 
+# ru_maxrss units per MiB: macOS reports bytes, Linux reports KB.
+_RSS_PER_MB = 1024 * 1024 if sys.platform == "darwin" else 1024
+
 
 class ToolbarConfig:
     """User-configurable toolbar with named widgets.
@@ -26,21 +31,39 @@ class ToolbarConfig:
     toolbar.add("name", fn)   -- register widget
     toolbar.remove("name")    -- unregister widget
     toolbar.widgets           -- list widget names
+
+    A widget registered with key_fn is only re-rendered when key_fn() returns
+    a different value than at its last render; widgets without one render on
+    every paint.
     """
 
     def __init__(self) -> None:
         self._widgets: dict[str, ToolbarWidget] = {}
         self._order: list[str] = []
-
-    def add(self, name: str, widget: ToolbarWidget) -> None:
-        """Register a named toolbar widget."""
+        self._key_fns: dict[str, Callable[[], Hashable]] = {}
+        # name -> (key, fragments) from the widget's last keyed render
+        self._cache: dict[str, tuple[Hashable, list[tuple[str, str]]]] = {}
+        self._flat: list[tuple[str, str]] | None = None
+
+    def add(
+        self, name: str, widget: ToolbarWidget, key_fn: Callable[[], Hashable] | None = None,
+    ) -> None:
+        """Register a named toolbar widget, optionally memoized on key_fn()."""
         if name not in self._widgets:
             self._order.append(name)
         self._widgets[name] = widget
+        self._key_fns.pop(name, None)
+        if key_fn is not None:
+            self._key_fns[name] = key_fn
+        self._cache.pop(name, None)
+        self._flat = None
 
     def remove(self, name: str) -> None:
         """Remove a toolbar widget by name."""
         self._widgets.pop(name, None)
+        self._key_fns.pop(name, None)
+        self._cache.pop(name, None)
+        self._flat = None
         if name in self._order:
             self._order.remove(name)
 
@@ -52,20 +75,56 @@ class ToolbarConfig:
     def render(self) -> list[tuple[str, str]]:
         """Render all widgets into a flat style tuple list."""
         parts: list[tuple[str, str]] = []
+        unchanged = True
+        all_keyed = True
         for name in self._order:
             fn = self._widgets.get(name)
-            if fn:
-                try:
-                    parts.extend(fn())
-                except Exception:
-                    parts.append(("fg:red", f" [{name}:err] "))
+            if not fn:
+                continue
+            key_fn = self._key_fns.get(name)
+            if key_fn is None:
+                unchanged = all_keyed = False
+                parts.extend(self._render_widget(name, fn))
+                continue
+            try:
+                key = key_fn()
+            except Exception:
+                key = _KEY_ERROR
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == key:
+                parts.extend(cached[1])
+                continue
+            unchanged = False
+            fragments = self._render_widget(name, fn) if key is not _KEY_ERROR else _err(name)
+            self._cache[name] = (key, fragments)
+            parts.extend(fragments)
+        # Every widget keyed and no key changed: hand back the previous list.
+        if unchanged and self._flat is not None:
+            return self._flat
+        self._flat = parts if all_keyed else None
         return parts
 
+    @staticmethod
+    def _render_widget(name: str, fn: ToolbarWidget) -> list[tuple[str, str]]:
+        try:
+            return list(fn())
+        except Exception:
+            return _err(name)
+
     def __repr__(self) -> str:
         names = ", ".join(self._order)
         return f"toolbar -- .add(name, fn), .remove(name). widgets: [{names}]"
 
 
+# Cache key for a widget whose key_fn raised: never equal to a real key, so the
+# error marker is cached until key_fn recovers.
+_KEY_ERROR = object()
+
+
+def _err(name: str) -> list[tuple[str, str]]:
+    return [("fg:red", f" [{name}:err] ")]
+
+
 def make_mode_widget(shell) -> ToolbarWidget:
     """Built-in widget: current mode name."""
     from bae.repl.modes import MODE_NAMES
@@ -85,26 +144,28 @@ def make_tasks_widget(shell) -> ToolbarWidget:
     return widget
 
 
+@functools.cache
 def make_cwd_widget() -> ToolbarWidget:
-    """Built-in widget: current working directory."""
+    """Built-in widget: current working directory (stateless, shared by all shells)."""
+    home = os.path.expanduser("~")
+    last: list = [None, None]  # (cwd, fragments) from the previous render
 
     def widget():
         cwd = os.getcwd()
-        home = os.path.expanduser("~")
-        if cwd.startswith(home):
-            cwd = "~" + cwd[len(home):]
-        return [("class:toolbar.cwd", f" {cwd} ")]
+        if cwd != last[0]:
+            shown = "~" + cwd[len(home):] if cwd.startswith(home) else cwd
+            last[:] = [cwd, [("class:toolbar.cwd", f" {shown} ")]]
+        return last[1]
 
     return widget
 
 
+@functools.cache
 def make_mem_widget() -> ToolbarWidget:
-    """Built-in widget: interpreter RSS memory usage."""
+    """Built-in widget: interpreter RSS memory usage (stateless, shared by all shells)."""
 
     def widget():
-        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        # macOS returns bytes, Linux returns KB
-        mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+        mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / _RSS_PER_MB
         return [("class:toolbar.mem", f" {mb:.0f}M ")]
 
     return widget
@@ -18,7 +18,7 @@ from io import StringIO
 from pathlib import Path
 
 from prompt_toolkit import print_formatted_text
-from prompt_toolkit.formatted_text import ANSI, FormattedText
+from prompt_toolkit.formatted_text import ANSI, FormattedText, to_formatted_text
 from rich import box
 from rich.console import Console, Group
 from rich.panel import Panel
@@ -87,17 +87,25 @@ def linkify_paths(text: str) -> str:
     return text
 
 
+_ANSI_CONSOLE: Console | None = None
+
+
 def _rich_to_ansi(renderable, width=None):
     """Render a Rich renderable to ANSI string for prompt_toolkit."""
+    global _ANSI_CONSOLE
     if width is None:
         try:
             width = os.get_terminal_size().columns
         except OSError:
             width = 80
-    buf = StringIO()
-    console = Console(file=buf, width=width, force_terminal=True)
-    console.print(renderable)
-    return buf.getvalue()
+    # One capture console for all renders: Console() probes the environment
+    # on construction, and panels render on every AI code execution.
+    if _ANSI_CONSOLE is None:
+        _ANSI_CONSOLE = Console(file=StringIO(), force_terminal=True)
+    _ANSI_CONSOLE.width = width
+    with _ANSI_CONSOLE.capture() as capture:
+        _ANSI_CONSOLE.print(renderable)
+    return capture.get()
 
 
 _STRIP_RUN_RE = re.compile(r"<run>\s*\n?.*?\n?\s*</run>", re.DOTALL)
@@ -120,6 +128,22 @@ def _strip_executable(text):
     return text.strip()
 
 
+# Graph lifecycle event -> style for the event text
+_LIFECYCLE_STYLES = {
+    "start": "fg:#808080",
+    "complete": "fg:#87ff87",
+    "fail": "fg:red",
+    "cancel": "fg:ansiyellow",
+    "transition": "fg:#808080",
+}
+
+
+def _panel_title(meta: dict) -> str:
+    """Rich-markup panel title: ai:<label> for labelled executions, else exec."""
+    label = meta.get("label", "")
+    return f"[bold cyan]ai:{label}[/]" if label else "[bold cyan]exec[/]"
+
+
 class UserView:
     """Framed panel display for AI code execution on [py] channel.
 
@@ -173,8 +197,7 @@ class UserView:
         if content_type == "lifecycle" and channel_name == "graph":
             label = f"[{channel_name}:{meta.get('run_id', '')}]"
             event = meta.get("event", "")
-            style_map = {"start": "fg:#808080", "complete": "fg:#87ff87", "fail": "fg:red", "cancel": "fg:ansiyellow", "transition": "fg:#808080"}
-            style = style_map.get(event, "")
+            style = _LIFECYCLE_STYLES.get(event, "")
             print_formatted_text(FormattedText([
                 (f"{color} bold", label),
                 ("", " "),
@@ -186,8 +209,7 @@ class UserView:
 
     def _render_grouped_panel(self, code, output, meta):
         """Render code + output as a single framed panel."""
-        label = meta.get("label", "")
-        title = f"ai:{label}" if label else "exec"
+        title = _panel_title(meta)
 
         parts = [Syntax(code, "python", theme="monokai")]
         if output and output != "(no output)":
@@ -199,7 +221,7 @@ class UserView:
 
         panel = Panel(
             Group(*parts),
-            title=f"[bold cyan]{title}[/]",
+            title=title,
             border_style="dim",
             box=box.ROUNDED,
             padding=(0, 1),
@@ -209,8 +231,7 @@ class UserView:
 
     def _render_code_panel(self, code, meta):
         """Render code-only panel (when output was never received)."""
-        label = meta.get("label", "")
-        title = f"ai:{label}" if label else "exec"
+        title = _panel_title(meta)
 
         panel = Panel(
             Group(
@@ -218,7 +239,7 @@ class UserView:
                 Rule(style="dim"),
                 Text("(executed)", style="dim italic"),
             ),
-            title=f"[bold cyan]{title}[/]",
+            title=title,
             border_style="dim",
             box=box.ROUNDED,
             padding=(0, 1),
@@ -253,18 +274,27 @@ class DebugView:
 
     def render(self, channel_name, color, content, *, metadata=None):
         meta = metadata or {}
-        if meta.get("type") == "ansi":
-            meta_str = " ".join(f"{k}={v}" for k, v in sorted(meta.items()))
-            header = f"[{channel_name}] {meta_str}"
-            print_formatted_text(FormattedText([(f"{color} bold", header)]))
-            print_formatted_text(ANSI(content))
-            return
         meta_str = " ".join(f"{k}={v}" for k, v in sorted(meta.items()))
         header = f"[{channel_name}] {meta_str}" if meta_str else f"[{channel_name}]"
-        print_formatted_text(FormattedText([(f"{color} bold", header)]))
-        linked = linkify_paths(content)
-        for line in linked.splitlines():
-            print_formatted_text(ANSI(f"  {line}"))
+        # Header and body go out in a single print_formatted_text write.
+        fragments = [(f"{color} bold", header)]
+        if meta.get("type") == "ansi":
+            fragments.append(("", "\n"))
+            fragments.extend(to_formatted_text(ANSI(content)))
+        else:
+            # Each line is parsed on its own so ANSI state never bleeds across lines.
+            # Walk newlines with find() rather than materialising splitlines().
+            linked = linkify_paths(content)
+            pos, end = 0, len(linked)
+            while pos < end:
+                nl = linked.find("\n", pos)
+                if nl == -1:
+                    nl = end
+                line = linked[pos:nl].removesuffix("\r")
+                fragments.append(("", "\n"))
+                fragments.extend(to_formatted_text(ANSI(f"  {line}")))
+                pos = nl + 1
+        print_formatted_text(FormattedText(fragments))
 
 
 class AISelfView:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
+import functools
 import graphlib
 import inspect
 import time
@@ -48,6 +49,16 @@ _engine_dep_cache: contextvars.ContextVar[dict | None] = contextvars.ContextVar(
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _class_hints(node_cls: type) -> types.MappingProxyType:
+    """get_type_hints(node_cls, include_extras=True), resolved once per class.
+
+    Classification, validation, recall and per-step resolution all read a
+    node class's annotations; read-only because the mapping is shared.
+    """
+    return types.MappingProxyType(get_type_hints(node_cls, include_extras=True))
+
+
 def _is_node_type(t: object) -> bool:
     """Check if t is a Node subclass (not Node itself). Deferred import."""
     from bae.node import Node
@@ -67,7 +78,7 @@ def classify_fields(node_cls: type) -> dict[str, str]:
     Returns:
         Dict mapping field name to ``"dep"``, ``"recall"``, or ``"plain"``.
     """
-    hints = get_type_hints(node_cls, include_extras=True)
+    hints = _class_hints(node_cls)
     result: dict[str, str] = {}
 
     for name, hint in hints.items():
@@ -120,7 +131,7 @@ def recall_from_trace(trace: list, target_type: type) -> object:
         if isinstance(node, target_type):
             return node
 
-        hints = get_type_hints(node.__class__, include_extras=True)
+        hints = _class_hints(node.__class__)
         for field_name, hint in hints.items():
             if field_name == "return":
                 continue
@@ -206,7 +217,7 @@ def build_dep_dag(node_cls: type) -> graphlib.TopologicalSorter:
     ts = graphlib.TopologicalSorter()
     visited: set = set()
 
-    hints = get_type_hints(node_cls, include_extras=True)
+    hints = _class_hints(node_cls)
     for field_name, hint in hints.items():
         if field_name == "return":
             continue
@@ -240,7 +251,7 @@ def validate_node_deps(node_cls: type, *, is_start: bool) -> list[str]:
         List of human-readable error strings. Empty list means valid.
     """
     errors: list[str] = []
-    hints = get_type_hints(node_cls, include_extras=True)
+    hints = _class_hints(node_cls)
 
     for field_name, hint in hints.items():
         if field_name == "return":
@@ -413,7 +424,7 @@ async def resolve_fields(node_cls: type, trace: list, dep_cache: dict) -> dict[s
     Returns:
         Dict mapping field name to resolved value for Dep, Recall, and Gate fields.
     """
-    hints = get_type_hints(node_cls, include_extras=True)
+    hints = _class_hints(node_cls)
 
     # Classify fields into dep, recall, and gate buckets
     # dep_fields maps field_name -> DAG key (callable or Node class)
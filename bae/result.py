@@ -8,7 +8,7 @@ from bae.node import Node
 T = TypeVar("T", bound=Node, default=Node)
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphResult(Generic[T]):
     """Result of executing a graph.
 
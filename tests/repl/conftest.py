@@ -0,0 +1,67 @@
+"""Shared fixtures for REPL tests."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bae.repl.store import SessionStore
+
+
+class _FakeProc:
+    """Stand-in for asyncio.subprocess.Process: plain attributes, mocked methods."""
+
+    __slots__ = ("pid", "returncode", "kill", "wait", "communicate")
+
+    def __init__(self, pid: int = 12345) -> None:
+        self.pid = pid
+        self.returncode = None
+        self.kill = MagicMock()
+        self.wait = AsyncMock()
+        self.communicate = AsyncMock(return_value=(b"", b""))
+
+
+@pytest.fixture
+def fake_proc():
+    """A fresh _FakeProc (pid 12345, still running)."""
+    return _FakeProc()
+
+
+# "[MODE:channel:direction] content" -- one SessionStore display line
+_TAG_RE = re.compile(r"\[([A-Z]+:[a-z]+:[a-z]+)\][^\n]*")
+
+
+@pytest.fixture
+def captured_index(capsys):
+    """Read captured stdout once and index store display lines by their tag.
+
+    Returns a callable so tests read output after the code under test ran;
+    each tag maps to its last display line, starting at the tag.
+    """
+    def _index() -> dict[str, str]:
+        out = capsys.readouterr().out
+        return {m.group(1): m.group(0) for m in _TAG_RE.finditer(out)}
+
+    return _index
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """In-memory database with the SessionStore schema, built once per run."""
+    conn = sqlite3.connect(":memory:")
+    SessionStore._create_schema(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def store(_schema_template):
+    """SessionStore on a fresh in-memory database cloned from the schema template."""
+    conn = sqlite3.connect(":memory:")
+    _schema_template.backup(conn)
+    s = SessionStore.from_connection(conn)
+    yield s
+    s.close()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from typing import Annotated
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -132,6 +132,15 @@ class TestBuildContext:
         assert "AlphaNode ->" in result
         assert "BetaNode" in result
 
+    def test_graph_topology_reads_cached_edges(self):
+        """ns(graph) context reuses the graph's sorted edges; no per-node edge copies."""
+        graph = Graph(start=AlphaNode)
+        ns = {"__builtins__": __builtins__, "graph": graph}
+        with patch.object(Graph, "edges", new_callable=PropertyMock) as edges:
+            result = _build_context(ns)
+        edges.assert_not_called()
+        assert f"  Nodes: {len(graph.nodes)}" in result
+
     def test_trace_summary(self):
         """Namespace with _trace list produces REPL-style trace output."""
         trace = [AlphaNode(query="q1"), BetaNode(answer="a", info="i")]
@@ -275,9 +284,9 @@ class TestCrossSessionContext:
     """Tests for SessionStore.cross_session_context."""
 
     @pytest.fixture
-    def store(self, tmp_path):
+    def store(self):
         from bae.repl.store import SessionStore
-        s = SessionStore(tmp_path / "ctx.db")
+        s = SessionStore(":memory:")
         yield s
         s.close()
 
@@ -13,45 +13,44 @@ from bae.repl.ai import AI
 from bae.repl.shell import CortexShell
 
 
+@pytest.fixture(scope="module")
+def shell():
+    """One CortexShell for the read-only wiring checks below."""
+    return CortexShell()
+
+
 class TestAIIntegration:
     """Tests verifying AI is wired into CortexShell correctly."""
 
-    def test_ai_in_namespace(self):
+    def test_ai_in_namespace(self, shell):
         """AI object is accessible in the shell namespace."""
-        shell = CortexShell()
         assert "ai" in shell.namespace
         assert isinstance(shell.namespace["ai"], AI)
 
-    def test_ai_repr_in_namespace(self):
+    def test_ai_repr_in_namespace(self, shell):
         """AI repr shows usage hint and session info."""
-        shell = CortexShell()
         r = repr(shell.namespace["ai"])
         assert "await ai('question')" in r
         assert "session " in r
 
-    def test_ai_has_router(self):
+    def test_ai_has_router(self, shell):
         """AI holds same router reference as shell."""
-        shell = CortexShell()
         assert shell.ai._router is shell.router
 
-    def test_ai_has_namespace(self):
+    def test_ai_has_namespace(self, shell):
         """AI holds same namespace reference (sees live state)."""
-        shell = CortexShell()
         assert shell.ai._namespace is shell.namespace
 
-    def test_ai_has_lm(self):
+    def test_ai_has_lm(self, shell):
         """AI delegates fill/choose_type to ClaudeCLIBackend."""
-        shell = CortexShell()
         assert isinstance(shell.ai._lm, ClaudeCLIBackend)
 
-    def test_ai_no_api_key_needed(self):
+    def test_ai_no_api_key_needed(self, shell):
         """AI construction succeeds without ANTHROPIC_API_KEY."""
-        shell = CortexShell()
         assert shell.ai._call_count == 0
 
-    def test_ai_extract_executable_from_namespace(self):
+    def test_ai_extract_executable_from_namespace(self, shell):
         """extract_executable is accessible on the namespace ai object."""
-        shell = CortexShell()
         blocks = shell.namespace["ai"].extract_executable("<run>\nx = 1\n</run>")
         assert blocks == ["x = 1"]
 
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from bae.repl.channels import (
+    BUFFER_MAXLEN,
     CHANNEL_DEFAULTS,
     Channel,
     ChannelRouter,
@@ -43,8 +44,7 @@ def hidden_channel(store):
 def router(store):
     """A ChannelRouter with default channels registered."""
     r = ChannelRouter()
-    for name, cfg in CHANNEL_DEFAULTS.items():
-        r.register(name, cfg["color"], store=store)
+    r.register_defaults(store=store)
     return r
 
 
@@ -67,7 +67,16 @@ def test_channel_write_buffers_content(channel):
     """Channel.write() always appends to _buffer."""
     channel.write("line 1")
     channel.write("line 2")
-    assert channel._buffer == ["line 1", "line 2"]
+    assert list(channel._buffer) == ["line 1", "line 2"]
+
+
+def test_channel_buffer_bounded(hidden_channel):
+    """Channel._buffer keeps only the most recent BUFFER_MAXLEN writes."""
+    for i in range(BUFFER_MAXLEN + 10):
+        hidden_channel.write(str(i))
+    assert len(hidden_channel._buffer) == BUFFER_MAXLEN
+    assert hidden_channel._buffer[0] == "10"
+    assert hidden_channel._buffer[-1] == str(BUFFER_MAXLEN + 9)
 
 
 def test_channel_write_visible_calls_display(channel):
@@ -93,7 +102,7 @@ def test_channel_write_hidden_still_records(hidden_channel, store):
 def test_channel_write_hidden_still_buffers(hidden_channel):
     """Channel.write() buffers content even when hidden."""
     hidden_channel.write("hello")
-    assert hidden_channel._buffer == ["hello"]
+    assert list(hidden_channel._buffer) == ["hello"]
 
 
 def test_channel_write_with_metadata(channel, store):
@@ -112,7 +121,7 @@ def test_channel_write_no_store():
     """Channel.write() works without a store (no error)."""
     ch = Channel(name="py", color="#87ff87")
     ch.write("hello")  # should not raise
-    assert ch._buffer == ["hello"]
+    assert list(ch._buffer) == ["hello"]
 
 
 @patch("bae.repl.channels.print_formatted_text")
@@ -167,6 +176,46 @@ def test_router_register(store):
     assert ch.store is store
 
 
+def test_router_register_defaults(store):
+    """register_defaults() registers every default channel with its color and markdown flag."""
+    r = ChannelRouter()
+    r.register_defaults(store=store)
+    assert r.all == list(CHANNEL_DEFAULTS)
+    assert r.ai.markdown is True
+    assert r.py.color == CHANNEL_DEFAULTS["py"]["color"]
+    assert r.py.store is store
+
+
+def test_router_register_defaults_independent_channels():
+    """Routers built from the defaults never share Channel objects or buffers."""
+    r1, r2 = ChannelRouter(), ChannelRouter()
+    r1.register_defaults()
+    r2.register_defaults()
+    r1.py.visible = False
+    r1.write("py", "only r1")
+    assert r1.py is not r2.py
+    assert r2.py.visible is True
+    assert list(r2.py._buffer) == []
+
+
+def test_router_register_defaults_custom_table():
+    """register_defaults() accepts a table other than CHANNEL_DEFAULTS."""
+    r = ChannelRouter()
+    r.register_defaults({"py": {"color": "#000000"}, "ai": {"color": "#111111", "markdown": True}})
+    assert r.all == ["py", "ai"]
+    assert r.py.color == "#000000"
+    assert r.ai.markdown is True
+
+
+def test_router_register_defaults_rejects_overlap():
+    """register_defaults() refuses to replace already-registered channels."""
+    r = ChannelRouter()
+    r.register("py", "#000000")
+    with pytest.raises(ValueError, match="py"):
+        r.register_defaults()
+    assert r.py.color == "#000000"
+
+
 def test_router_write_dispatches(router, store):
     """ChannelRouter.write() dispatches to the named channel."""
     router.write("py", "hello", mode="PY")
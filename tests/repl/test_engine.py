@@ -120,6 +120,28 @@ class SlowLM(MockLM):
         return target.model_construct(**resolved)
 
 
+class Recorder:
+    """Notify callback that indexes (content, meta) by meta type as it records.
+
+    Assertions read the pre-built index instead of re-filtering every event.
+    """
+
+    def __init__(self):
+        self.events: list[tuple[str, dict | None]] = []
+        self._index: dict[str | tuple[str, str], list[tuple[str, dict]]] = {}
+
+    def __call__(self, content, meta=None):
+        self.events.append((content, meta))
+        if meta:
+            entry = (content, meta)
+            self._index.setdefault(meta.get("type"), []).append(entry)
+            if "event" in meta:
+                self._index.setdefault((meta.get("type"), meta["event"]), []).append(entry)
+
+    def of_type(self, kind: str, event: str | None = None) -> list[tuple[str, dict]]:
+        return self._index.get(kind if event is None else (kind, event), [])
+
+
 @pytest.fixture
 def tm():
     return TaskManager()
@@ -201,6 +223,12 @@ class TestTimingLM:
         result = await timing_lm.decide(node)
         assert result is None
 
+    def test_untimed_methods_bound_to_inner(self, mock_lm):
+        """choose_type/decide are the inner LM's bound methods, not wrappers."""
+        timing_lm = TimingLM(mock_lm, GraphRun(run_id="g1", graph=None))
+        assert timing_lm.choose_type == mock_lm.choose_type
+        assert timing_lm.decide == mock_lm.decide
+
 
 # --- TestGraphRegistry ---
 
@@ -232,6 +260,38 @@ class TestGraphRegistry:
         assert any("Start" in tt.name for tt in active)
         await tm.shutdown()
 
+    async def test_submit_many_allocates_sequential_runs(self, registry, tm, mock_lm):
+        """submit_many() returns one RUNNING run per input with consecutive run_ids."""
+        from bae.graph import Graph
+
+        graph = Graph(start=Start)
+        registry.submit(graph, tm, lm=mock_lm, text="first")
+        runs = registry.submit_many(
+            graph, tm, [{"text": "a"}, {"text": "b"}, {"text": "c"}], lm=mock_lm,
+        )
+        assert [r.run_id for r in runs] == ["g2", "g3", "g4"]
+        assert all(r.state == GraphState.RUNNING for r in runs)
+        assert len(tm.active()) == 4
+
+        run = registry.submit(graph, tm, lm=mock_lm, text="last")
+        assert run.run_id == "g5"
+        await tm.shutdown()
+
+    async def test_submit_group_waits_for_all_runs(self, registry, tm):
+        """submit_group() returns after every run finishes, reporting failures per run."""
+        from bae.graph import Graph
+
+        graph = Graph(start=StressStart)
+        ok = await registry.submit_group(graph, tm, [{"text": "a"}] * 3, lm=MockLM())
+        assert all(r.state == GraphState.DONE for r in ok)
+
+        failed = await registry.submit_group(
+            Graph(start=Start), tm, [{"text": "b"}], lm=FailingLM(),
+        )
+        assert failed[0].state == GraphState.FAILED
+        assert not registry.active()
+        await _drain_tasks(tm)
+
     async def test_run_completes_to_done(self, registry, tm, mock_lm):
         """Submit a graph with MockLM, await the task, verify run.state == DONE."""
         from bae.graph import Graph
@@ -724,19 +784,15 @@ class TestGateHook:
         """Notify callback receives gate schema when gates are created."""
         from bae.graph import Graph
 
-        notifications = []
+        notifications = Recorder()
         graph = Graph(start=GatedStart)
-        run = registry.submit(
-            graph, tm, lm=MockLM(),
-            notify=lambda content, meta=None: notifications.append((content, meta)),
-            text="hi",
-        )
+        run = registry.submit(graph, tm, lm=MockLM(), notify=notifications, text="hi")
         for _ in range(100):
             if run.state == GraphState.WAITING:
                 break
             await asyncio.sleep(0.01)
-        # Filter to gate notifications (ignore lifecycle events)
-        gate_notifs = [(c, m) for c, m in notifications if m and m.get("type") == "gate"]
+        # Gate notifications only (lifecycle events are indexed separately)
+        gate_notifs = notifications.of_type("gate")
         assert len(gate_notifs) == 1
         content, meta = gate_notifs[0]
         assert "approved" in content
@@ -818,16 +874,12 @@ class TestNotifyMetadata:
         """Notify callback receives (content, meta) with lifecycle events."""
         from bae.graph import Graph
 
-        events = []
+        events = Recorder()
         graph = Graph(start=Start)
-        run = registry.submit(
-            graph, tm, lm=mock_lm,
-            notify=lambda content, meta=None: events.append((content, meta)),
-            text="hello",
-        )
+        run = registry.submit(graph, tm, lm=mock_lm, notify=events, text="hello")
         await _drain_tasks(tm)
         assert run.state == GraphState.DONE
-        lifecycle = [(c, m) for c, m in events if m and m.get("type") == "lifecycle"]
+        lifecycle = events.of_type("lifecycle")
         assert len(lifecycle) >= 2  # start + complete
         event_types = {m["event"] for _, m in lifecycle}
         assert "start" in event_types
@@ -853,22 +905,14 @@ async def test_concurrent_graphs_no_starvation():
     graph = Graph(start=StressStart)
     registry = GraphRegistry()
     tm = TaskManager()
-    events = []
-
-    def notify(content, meta=None):
-        events.append((content, meta))
-
-    runs = []
-    for _ in range(15):
-        run = registry.submit(
-            graph, tm, lm=MockLM(), notify=notify, text=f"stress",
-        )
-        runs.append(run)
+    notify = Recorder()
 
     # Wait for all 15 to complete with 10s timeout
     async with asyncio.timeout(10):
-        while registry.active():
-            await asyncio.sleep(0.05)
+        runs = await registry.submit_group(
+            graph, tm, [{"text": "stress"}] * 15, lm=MockLM(), notify=notify,
+        )
+    assert not registry.active()
 
     await _drain_tasks(tm)
 
@@ -886,9 +930,9 @@ async def test_concurrent_graphs_no_starvation():
         assert elapsed_s < 5, f"{run.run_id} took {elapsed_s:.1f}s (starvation)"
 
     # At least one start and one complete per graph (30+ lifecycle events)
-    lifecycle = [(c, m) for c, m in events if m and m.get("type") == "lifecycle"]
-    starts = [m for _, m in lifecycle if m.get("event") == "start"]
-    completes = [m for _, m in lifecycle if m.get("event") == "complete"]
+    lifecycle = notify.of_type("lifecycle")
+    starts = notify.of_type("lifecycle", "start")
+    completes = notify.of_type("lifecycle", "complete")
     assert len(starts) >= 15, f"expected 15+ starts, got {len(starts)}"
     assert len(completes) >= 15, f"expected 15+ completes, got {len(completes)}"
     assert len(lifecycle) >= 30, f"expected 30+ lifecycle events, got {len(lifecycle)}"
@@ -898,50 +942,106 @@ async def test_concurrent_graphs_no_starvation():
 
 async def test_concurrent_no_channel_flood():
     """QUIET policy prevents channel flooding for 15 successful graphs."""
-    from pathlib import Path
-    import tempfile
     from bae.graph import Graph
     from bae.repl.channels import ChannelRouter
     from bae.repl.store import SessionStore
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        store = SessionStore(Path(tmpdir) / "test.db")
-        router = ChannelRouter()
-        router.register("graph", color="#ffaf87", store=store)
-        # Suppress terminal output during test
-        router._channels["graph"].visible = False
+    store = SessionStore(":memory:")
+    router = ChannelRouter()
+    router.register("graph", color="#ffaf87", store=store)
+    # Suppress terminal output during test
+    router._channels["graph"].visible = False
 
-        graph = Graph(start=StressStart)
-        registry = GraphRegistry()
-        tm = TaskManager()
+    graph = Graph(start=StressStart)
+    registry = GraphRegistry()
+    tm = TaskManager()
 
-        def notify(content, meta=None):
-            router.write("graph", content, mode="GRAPH", metadata=meta)
+    def notify(content, meta=None):
+        router.write("graph", content, mode="GRAPH", metadata=meta)
 
-        for _ in range(15):
-            registry.submit(
-                graph, tm, lm=MockLM(), notify=notify,
-                policy=OutputPolicy.QUIET, text="quiet",
-            )
+    async with asyncio.timeout(10):
+        await registry.submit_group(
+            graph, tm, [{"text": "quiet"}] * 15, lm=MockLM(), notify=notify,
+            policy=OutputPolicy.QUIET,
+        )
 
-        async with asyncio.timeout(10):
-            while registry.active():
-                await asyncio.sleep(0.05)
+    await _drain_tasks(tm)
 
-        await _drain_tasks(tm)
+    # Channel buffer bounded (QUIET + no failures = no events emitted)
+    buf = router._channels["graph"]._buffer
+    assert len(buf) < 100, f"channel buffer has {len(buf)} entries (flooding)"
 
-        # Channel buffer bounded (QUIET + no failures = no events emitted)
-        buf = router._channels["graph"]._buffer
-        assert len(buf) < 100, f"channel buffer has {len(buf)} entries (flooding)"
+    # QUIET successful graphs should emit zero events (only fail/gate/error emit)
+    entries = store.session_entries()
+    graph_entries = [e for e in entries if e["channel"] == "graph"]
+    assert len(graph_entries) == 0, (
+        f"QUIET successful graphs should emit 0 events, got {len(graph_entries)}"
+    )
 
-        # QUIET successful graphs should emit zero events (only fail/gate/error emit)
-        entries = store.session_entries()
-        graph_entries = [e for e in entries if e["channel"] == "graph"]
-        assert len(graph_entries) == 0, (
-            f"QUIET successful graphs should emit 0 events, got {len(graph_entries)}"
-        )
+    store.close()
+
+
+# --- Admission priority / aging ---
+
+
+def _admission_order(runs):
+    return [r.run_id for r in sorted(runs, key=lambda r: r.admitted_ns)]
 
-        store.close()
+
+async def test_max_concurrent_queues_excess_runs():
+    """Runs beyond max_concurrent wait QUEUED and still count as active."""
+    from bae.graph import Graph
+
+    graph = Graph(start=StressStart)
+    registry = GraphRegistry(max_concurrent=2)
+    tm = TaskManager()
+    runs = registry.submit_many(graph, tm, [{"text": "q"}] * 5, lm=MockLM())
+    await asyncio.sleep(0)
+
+    states = [r.state for r in runs]
+    assert states.count(GraphState.RUNNING) == 2
+    assert states.count(GraphState.QUEUED) == 3
+    assert len(registry.active()) == 5
+
+    await _drain_tasks(tm)
+    assert all(r.state == GraphState.DONE for r in runs)
+
+
+async def test_priority_admits_high_before_low():
+    """With aging off, queued high-priority runs are admitted before earlier low ones."""
+    from bae.graph import Graph
+
+    graph = Graph(start=StressStart)
+    registry = GraphRegistry(max_concurrent=1, aging_per_s=0)
+    tm = TaskManager()
+    low = registry.submit_many(graph, tm, [{"text": "low"}] * 3, lm=MockLM())
+    high = registry.submit_many(
+        graph, tm, [{"text": "high"}] * 2, lm=MockLM(), priority=5,
+    )
+    await _drain_tasks(tm)
+
+    order = _admission_order(low + high)
+    assert order == ["g1", "g4", "g5", "g2", "g3"]
+
+
+async def test_aging_promotes_long_waiters():
+    """Low-priority runs that queued long enough outrank later high-priority runs."""
+    from bae.graph import Graph
+
+    graph = Graph(start=StressStart)
+    registry = GraphRegistry(max_concurrent=1, aging_per_s=10_000)
+    tm = TaskManager()
+    low = registry.submit_many(graph, tm, [{"text": "low"}] * 10, lm=MockLM())
+    await asyncio.sleep(0.005)
+    high = registry.submit_many(
+        graph, tm, [{"text": "high"}] * 5, lm=MockLM(), priority=5,
+    )
+    await _drain_tasks(tm)
+
+    # 5ms of queueing at 10k/s outweighs a priority boost of 5: FIFO holds
+    assert _admission_order(low + high) == [r.run_id for r in low + high]
+    waits = sorted(r.admitted_ns - r.started_ns for r in low)
+    assert waits[-1] <= 10 * waits[len(waits) // 2]
 
 
 # --- Store persistence tests ---
@@ -950,61 +1050,57 @@ async def test_concurrent_no_channel_flood():
 async def test_graph_events_persist_to_store():
     """Graph events persist through the full channel -> store pipeline and are searchable."""
     import json
-    import tempfile
-    from pathlib import Path
     from bae.graph import Graph
     from bae.repl.channels import ChannelRouter
     from bae.repl.store import SessionStore
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        store = SessionStore(db_path)
-        router = ChannelRouter()
-        router.register("graph", color="#ffaf87", store=store)
-        router._channels["graph"].visible = False
-
-        graph = Graph(start=StressStart)
-        registry = GraphRegistry()
-        tm = TaskManager()
-
-        # Notify callback matching real _make_notify pattern
-        def notify(content, meta=None):
-            router.write("graph", content, mode="GRAPH", metadata=meta)
-
-        # Submit with VERBOSE so all events emit
-        run = registry.submit(
-            graph, tm, lm=MockLM(), notify=notify,
-            policy=OutputPolicy.VERBOSE, text="persist-test",
-        )
-
-        async with asyncio.timeout(10):
-            while registry.active():
-                await asyncio.sleep(0.05)
-        await _drain_tasks(tm)
-        assert run.state == GraphState.DONE
+    store = SessionStore(":memory:")
+    router = ChannelRouter()
+    router.register("graph", color="#ffaf87", store=store)
+    router._channels["graph"].visible = False
 
-        # Query store for graph channel entries
-        entries = store.session_entries()
-        graph_entries = [e for e in entries if e["channel"] == "graph"]
-        assert len(graph_entries) >= 2, (
-            f"expected 2+ graph entries (start + complete), got {len(graph_entries)}"
-        )
-
-        # Check metadata on persisted entries
-        metas = [json.loads(e["metadata"]) for e in graph_entries]
-        events = [m.get("event") for m in metas if m.get("type") == "lifecycle"]
-        assert "start" in events, f"no start event in store, got {events}"
-        assert "complete" in events, f"no complete event in store, got {events}"
+    graph = Graph(start=StressStart)
+    registry = GraphRegistry()
+    tm = TaskManager()
 
-        # Content is non-empty for each entry
-        for e in graph_entries:
-            assert e["content"], f"empty content in entry {e}"
+    # Notify callback matching real _make_notify pattern
+    def notify(content, meta=None):
+        router.write("graph", content, mode="GRAPH", metadata=meta)
 
-        # FTS5 search works on graph events
-        search_results = store.search("started")
-        assert len(search_results) >= 1, "FTS5 search for 'started' returned nothing"
+    # Submit with VERBOSE so all events emit
+    run = registry.submit(
+        graph, tm, lm=MockLM(), notify=notify,
+        policy=OutputPolicy.VERBOSE, text="persist-test",
+    )
 
-        store.close()
+    async with asyncio.timeout(10):
+        while registry.active():
+            await asyncio.sleep(0.05)
+    await _drain_tasks(tm)
+    assert run.state == GraphState.DONE
+
+    # Query store for graph channel entries
+    entries = store.session_entries()
+    graph_entries = [e for e in entries if e["channel"] == "graph"]
+    assert len(graph_entries) >= 2, (
+        f"expected 2+ graph entries (start + complete), got {len(graph_entries)}"
+    )
+
+    # Check metadata on persisted entries
+    metas = [json.loads(e["metadata"]) for e in graph_entries]
+    events = [m.get("event") for m in metas if m.get("type") == "lifecycle"]
+    assert "start" in events, f"no start event in store, got {events}"
+    assert "complete" in events, f"no complete event in store, got {events}"
+
+    # Content is non-empty for each entry
+    for e in graph_entries:
+        assert e["content"], f"empty content in entry {e}"
+
+    # FTS5 search works on graph events
+    search_results = store.search("started")
+    assert len(search_results) >= 1, "FTS5 search for 'started' returned nothing"
+
+    store.close()
 
 
 async def test_store_cross_session_graph_events():
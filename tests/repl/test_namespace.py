@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
+import io
 import os
 import textwrap
 from typing import Annotated
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+import bae
 from bae.graph import Graph
 from bae.markers import Dep, Recall
 from bae.node import Node
-from bae.repl.namespace import NsInspector, seed
+from bae.repl.exec import _ensure_cortex_module
+from bae.repl.namespace import NsInspector, _first_doc_line, seed
 
 
 # --- Test fixtures using real bae types ---
@@ -53,14 +57,15 @@ class EndNode(Node):
         ...
 
 
-@pytest.fixture
-def graph():
-    return Graph(start=StartNode)
+# seed() once per module; each test gets a shallow copy with its own inspector.
+_BASE_NS = seed()
 
 
 @pytest.fixture
 def ns_dict():
-    return seed()
+    ns = dict(_BASE_NS)
+    ns["ns"] = NsInspector(ns)
+    return ns
 
 
 @pytest.fixture
@@ -73,21 +78,17 @@ def inspector(ns_dict):
 
 def test_seed_contains_core_types(ns_dict):
     """seed() includes Node, Graph, Dep, Recall."""
-    from bae import Node as BaeNode, Graph as BaeGraph, Dep as BaeDep, Recall as BaeRecall
-
-    assert ns_dict["Node"] is BaeNode
-    assert ns_dict["Graph"] is BaeGraph
-    assert ns_dict["Dep"] is BaeDep
-    assert ns_dict["Recall"] is BaeRecall
+    assert ns_dict["Node"] is bae.Node
+    assert ns_dict["Graph"] is bae.Graph
+    assert ns_dict["Dep"] is bae.Dep
+    assert ns_dict["Recall"] is bae.Recall
 
 
 def test_seed_contains_extras(ns_dict):
     """seed() includes GraphResult, LM, NodeConfig."""
-    from bae import GraphResult, LM, NodeConfig
-
-    assert ns_dict["GraphResult"] is GraphResult
-    assert ns_dict["LM"] is LM
-    assert ns_dict["NodeConfig"] is NodeConfig
+    assert ns_dict["GraphResult"] is bae.GraphResult
+    assert ns_dict["LM"] is bae.LM
+    assert ns_dict["NodeConfig"] is bae.NodeConfig
 
 
 def test_seed_contains_annotated(ns_dict):
@@ -118,6 +119,14 @@ def test_seed_ns_inspector_bound_to_dict(ns_dict):
     assert inspector._ns is ns_dict
 
 
+def test_seed_returns_fresh_dicts():
+    """Each seed() call gets its own namespace and inspector."""
+    ns1, ns2 = seed(), seed()
+    ns1["_test_marker"] = True
+    assert "_test_marker" not in ns2
+    assert ns1["ns"]._ns is ns1 and ns2["ns"]._ns is ns2
+
+
 # --- NsInspector.__repr__ ---
 
 
@@ -138,43 +147,43 @@ def test_list_all_skips_underscore_keys(inspector, ns_dict, capsys):
     assert "__builtins__" not in output
 
 
-def test_list_all_shows_non_underscore_entries(inspector, capsys):
-    """ns() prints entries for non-underscore namespace keys."""
-    inspector()
-    output = capsys.readouterr().out
-    assert "Node" in output
-    assert "Graph" in output
-    assert "Dep" in output
-    assert "Recall" in output
-    assert "ns" in output
+@pytest.fixture(scope="module")
+def list_all_lines():
+    """ns() output rendered once per module, keyed by entry name in print order."""
+    ns = dict(_BASE_NS)
+    ns["ns"] = NsInspector(ns)
+    ns["StartNode"] = StartNode
+    ns["mylist"] = [1, 2, 3]
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        ns["ns"]()
+    return {line.split()[0]: line for line in buf.getvalue().splitlines()}
 
 
-def test_list_all_shows_class_type_label(inspector, capsys):
-    """ns() labels types as 'class'."""
-    inspector()
-    output = capsys.readouterr().out
-    # Find line with Node
-    lines = output.strip().splitlines()
-    node_line = [l for l in lines if l.strip().startswith("Node")][0]
-    assert "class" in node_line
+@pytest.mark.parametrize("name", ["Node", "Graph", "Dep", "Recall", "ns"])
+def test_list_all_shows_non_underscore_entries(list_all_lines, name):
+    """ns() prints entries for non-underscore namespace keys."""
+    assert name in list_all_lines
 
 
-def test_list_all_shows_instance_type_label(inspector, ns_dict, capsys):
-    """ns() labels instances with type(obj).__name__."""
-    ns_dict["mylist"] = [1, 2, 3]
-    inspector()
-    output = capsys.readouterr().out
-    lines = output.strip().splitlines()
-    list_line = [l for l in lines if "mylist" in l][0]
-    assert "list" in list_line
+@pytest.mark.parametrize(
+    "name, needle",
+    [
+        ("Node", "class"),  # types are labelled 'class'
+        ("mylist", "list"),  # instances are labelled type(obj).__name__
+        ("StartNode", "Analyze the request"),  # class summary is its docstring's first line
+        ("asyncio", "asyncio"),  # module summary is the module name
+        ("ns", "inspect"),  # NsInspector summary is its usage hint
+    ],
+)
+def test_list_all_entry_line(list_all_lines, name, needle):
+    """Each ns() line carries the entry's type label and one-line summary."""
+    assert needle in list_all_lines[name]
 
 
-def test_list_all_sorted_alphabetically(inspector, capsys):
+def test_list_all_sorted_alphabetically(list_all_lines):
     """ns() output is sorted alphabetically by name."""
-    inspector()
-    output = capsys.readouterr().out
-    lines = output.strip().splitlines()
-    names = [l.split()[0] for l in lines if l.strip()]
+    names = list(list_all_lines)
     assert names == sorted(names)
 
 
@@ -184,61 +193,67 @@ def test_list_all_column_aligned(inspector, ns_dict, capsys):
     ns_dict["x"] = 42
     inspector()
     output = capsys.readouterr().out
-    lines = output.strip().splitlines()
+    lines = [line for line in output.splitlines() if line.startswith("  ")]
     assert len(lines) >= 2
     # The format is "  {name:<N}  {type:<M}  {summary}" -- the second column
-    # position should be identical across all lines. Use regex to find column 2.
-    import re
-    # Match leading indent + name + spaces + type_label
-    # Column 2 starts after "  {padded_name}  "
+    # starts at the first non-space after the name and must match on every line.
     col2_positions = []
     for line in lines:
-        # Find the position where the non-space text after the first column starts
-        m = re.match(r"^  (\S+)(\s+)(\S+)", line)
-        if m:
-            col2_positions.append(m.start(3))
+        name_end = line.index(" ", 2)
+        col2_positions.append(len(line) - len(line[name_end:].lstrip()))
     assert len(set(col2_positions)) == 1, f"Columns not aligned: positions={col2_positions}"
 
 
-# --- NsInspector(graph) -- graph inspection ---
-
-
-def test_inspect_graph_shows_start(inspector, graph, capsys):
-    """ns(graph) prints Graph(start=StartNode)."""
-    inspector(graph)
+def test_list_all_reflects_rebinding(inspector, ns_dict, capsys):
+    """ns() output tracks names added or rebound since the previous call."""
+    inspector()
+    capsys.readouterr()
+    ns_dict["StartNode"] = StartNode
+    inspector()
+    assert "Analyze the request" in capsys.readouterr().out
+    ns_dict["StartNode"] = MiddleNode
+    inspector()
     output = capsys.readouterr().out
-    assert "Graph(start=StartNode)" in output
+    assert "Process the analysis." in output
+    assert "Analyze the request" not in output
 
 
-def test_inspect_graph_shows_node_count(inspector, graph, capsys):
-    """ns(graph) prints node count."""
-    inspector(graph)
-    output = capsys.readouterr().out
-    assert f"Nodes: {len(graph.nodes)}" in output
+def test_list_all_reflects_mutated_values(inspector, ns_dict, capsys):
+    """ns() re-renders repr-based summaries so in-place mutation shows up."""
+    ns_dict["items"] = [1, 2]
+    inspector()
+    capsys.readouterr()
+    ns_dict["items"].append(3)
+    inspector()
+    assert "[1, 2, 3]" in capsys.readouterr().out
 
 
-def test_inspect_graph_shows_edges(inspector, graph, capsys):
-    """ns(graph) prints node edges."""
-    inspector(graph)
-    output = capsys.readouterr().out
-    assert "StartNode ->" in output
-    assert "MiddleNode" in output
-    assert "EndNode" in output
+# --- NsInspector(graph) -- graph inspection ---
 
 
-def test_inspect_graph_shows_terminal_marker(inspector, graph, capsys):
-    """ns(graph) shows (terminal) for nodes without successors."""
-    inspector(graph)
-    output = capsys.readouterr().out
-    assert "(terminal)" in output
+@pytest.fixture(scope="module")
+def graph_output():
+    """ns(graph) output rendered once per module."""
+    graph = Graph(start=StartNode)
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        NsInspector({})(graph)
+    return buf.getvalue()
 
 
-def test_inspect_graph_shows_terminals_list(inspector, graph, capsys):
-    """ns(graph) prints Terminals line with terminal node names."""
-    inspector(graph)
-    output = capsys.readouterr().out
-    assert "Terminals:" in output
-    assert "EndNode" in output
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "Graph(start=StartNode)",  # start node header
+        "Nodes: 3",  # node count
+        "StartNode -> EndNode, MiddleNode",  # sorted successor edges
+        "EndNode -> (terminal)",  # terminal marker for nodes without successors
+        "Terminals: EndNode",  # terminal summary line
+    ],
+)
+def test_inspect_graph(graph_output, needle):
+    """ns(graph) prints start, node count, edges and terminals."""
+    assert needle in graph_output
 
 
 # --- NsInspector(NodeSubclass) -- node class inspection ---
@@ -296,6 +311,25 @@ def test_inspect_node_class_dep_annotation(inspector, capsys):
     assert "Dep(fetch_weather)" in output
 
 
+def test_inspect_node_class_reuses_resolver_hints(inspector, capsys):
+    """ns(NodeClass) reads the resolver's per-class hints instead of resolving again."""
+    inspector(MiddleNode)
+    capsys.readouterr()
+    with patch("bae.resolver.get_type_hints") as mock_hints:
+        inspector(MiddleNode)
+    mock_hints.assert_not_called()
+    assert "Dep(fetch_weather)" in capsys.readouterr().out
+
+
+def test_first_doc_line_keyed_on_docstring():
+    """_first_doc_line memoizes on the docstring, so an edited doc is re-read."""
+    assert _first_doc_line(StartNode.__doc__) == "Analyze the request and decide next step."
+    hits = _first_doc_line.cache_info().hits
+    _first_doc_line(StartNode.__doc__)
+    assert _first_doc_line.cache_info().hits == hits + 1
+    assert _first_doc_line("\n    Edited summary.\n\n    More.\n") == "Edited summary."
+
+
 def test_inspect_node_class_recall_annotation(inspector, capsys):
     """ns(NodeClass) shows Recall() for recall fields."""
     inspector(EndNode)
@@ -344,51 +378,18 @@ def test_inspect_generic_truncates_long_repr(inspector, capsys):
     assert len(output.strip()) <= 250  # some slack for type prefix
 
 
-# --- _one_liner helper (tested through _list_all) ---
-
-
-def test_one_liner_type_uses_docstring(inspector, ns_dict, capsys):
-    """_one_liner for a class with docstring uses its first line."""
-    ns_dict["StartNode"] = StartNode
-    inspector()
-    output = capsys.readouterr().out
-    lines = output.strip().splitlines()
-    start_line = [l for l in lines if l.strip().startswith("StartNode")][0]
-    assert "Analyze the request" in start_line
-
-
-def test_one_liner_module_shows_module(inspector, capsys):
-    """_one_liner for a module uses the module name."""
-    inspector()
-    output = capsys.readouterr().out
-    lines = output.strip().splitlines()
-    asyncio_line = [l for l in lines if l.strip().startswith("asyncio")][0]
-    assert "module" in asyncio_line.lower() or "asyncio" in asyncio_line
-
-
-def test_one_liner_ns_inspector(inspector, capsys):
-    """_one_liner for NsInspector shows usage hint."""
-    inspector()
-    output = capsys.readouterr().out
-    lines = output.strip().splitlines()
-    ns_line = [l for l in lines if l.strip().startswith("ns ")][0]
-    assert "inspect" in ns_line.lower() or "namespace" in ns_line.lower()
-
-
 # --- REPL-defined class annotation resolution ---
 
 
-async def test_inspect_repl_defined_node_class(capsys):
-    """ns(NodeClass) works for classes defined via async_exec (REPL simulation).
+def test_inspect_repl_defined_node_class(capsys):
+    """ns(NodeClass) works for classes defined in the REPL namespace.
 
-    Classes defined in the REPL get __module__='<cortex>' from compile().
-    _ensure_cortex_module registers <cortex> in sys.modules so
-    get_type_hints() can resolve Annotated/Dep/Recall annotations.
+    Classes defined in the REPL get __module__='<cortex>' from the namespace's
+    __name__. _ensure_cortex_module sets that and registers <cortex> in
+    sys.modules so get_type_hints() can resolve Annotated/Dep/Recall annotations.
     """
-    from bae.repl.exec import async_exec
-
     ns = seed()
-    # Define a Node subclass as the REPL would -- via async_exec
+    # Define a Node subclass as async_exec would, minus the await wrapper
     code = textwrap.dedent("""\
         class TestNode(Node):
             query: str
@@ -396,7 +397,8 @@ async def test_inspect_repl_defined_node_class(capsys):
 
             async def __call__(self) -> None: ...
     """)
-    await async_exec(code, ns)
+    _ensure_cortex_module(ns)
+    exec(compile(code, "<cortex>", "exec"), ns)
 
     test_cls = ns["TestNode"]
     assert test_cls.__module__ == "<cortex>"
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+import bae
 from bae.exceptions import BaeError
 from bae.graph import Graph
 from bae.markers import Dep, Recall
@@ -40,16 +41,35 @@ class End(Node):
 # --- Fixtures ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def shell():
     return CortexShell()
 
 
+@pytest.fixture(autouse=True)
+def _restore_namespace(shell):
+    """Undo per-test namespace writes (_, _trace) on the shared shell."""
+    snapshot = dict(shell.namespace)
+    yield
+    shell.namespace.clear()
+    shell.namespace.update(snapshot)
+
+
+class FakeRouter:
+    """Records router.write() calls without MagicMock's bookkeeping."""
+
+    __slots__ = ("writes",)
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, *args, **kwargs):
+        self.writes.append((args, kwargs))
+
+
 @pytest.fixture
 def mock_router():
-    r = MagicMock()
-    r.write = MagicMock()
-    return r
+    return FakeRouter()
 
 
 # --- Test 1: Shell namespace contains bae types ---
@@ -58,12 +78,11 @@ def mock_router():
 def test_shell_namespace_has_core_types(shell):
     """CortexShell namespace contains Node, Graph, Dep, Recall from seed()."""
     ns = shell.namespace
-    from bae import Node as BaeNode, Graph as BaeGraph, Dep as BaeDep, Recall as BaeRecall
 
-    assert ns["Node"] is BaeNode
-    assert ns["Graph"] is BaeGraph
-    assert ns["Dep"] is BaeDep
-    assert ns["Recall"] is BaeRecall
+    assert ns["Node"] is bae.Node
+    assert ns["Graph"] is bae.Graph
+    assert ns["Dep"] is bae.Dep
+    assert ns["Recall"] is bae.Recall
 
 
 def test_shell_namespace_has_ns_inspector(shell):
@@ -121,6 +140,7 @@ async def test_trace_capture_success(mock_router):
     assert isinstance(result.trace[0], Start)
     assert isinstance(result.trace[1], End)
     assert result.trace[1].result == "hello"
+    assert mock_router.writes[-1][0][0] == "graph"
 
 
 @pytest.mark.asyncio
@@ -2,19 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
+import json
 import sqlite3
 
 import pytest
 
-from bae.repl.store import SessionStore
-
-
-@pytest.fixture
-def store(tmp_path):
-    """Create a SessionStore with a temporary database."""
-    s = SessionStore(tmp_path / "test.db")
-    yield s
-    s.close()
+from bae.repl.store import SessionStore, close_pool
 
 
 def test_init_creates_session(tmp_path):
@@ -29,6 +23,59 @@ def test_init_creates_session(tmp_path):
     s.close()
 
 
+def test_init_accepts_memory_uri():
+    """SessionStore accepts a shared-cache file: URI without touching disk."""
+    s = SessionStore("file:store_uri_test?mode=memory&cache=shared")
+    s.record("PY", "repl", "input", "in memory")
+    assert s.session_entries()[0]["content"] == "in memory"
+    s.close()
+
+
+def test_init_file_uri_is_on_disk(tmp_path):
+    """A file: URI without mode=memory opens a real database, creating its directory."""
+    db = tmp_path / "nested" / "uri.db"
+    s = SessionStore(f"file:{db}?mode=rwc")
+    s.record("PY", "repl", "input", "on disk")
+    assert s._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert s._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    s.close()
+    assert db.exists()
+
+
+def test_pragmas_match_backing(tmp_path):
+    """In-memory stores skip durability work; file stores use WAL with NORMAL sync."""
+    m = SessionStore(":memory:")
+    assert m._conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+    m.close()
+    s = SessionStore(tmp_path / "test.db")
+    assert s._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert s._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    s.close()
+
+
+def test_from_pool_shares_connection(tmp_path):
+    """Pooled stores for one file share a connection that survives close()."""
+    db = tmp_path / "pooled.db"
+    s1 = SessionStore.from_pool(db)
+    s2 = SessionStore.from_pool(db)
+    assert s1._conn is s2._conn
+    assert s1.session_id != s2.session_id
+    s1.close()
+    s2.record("PY", "repl", "input", "still open")
+    close_pool(db)
+    with pytest.raises(sqlite3.ProgrammingError):
+        s2.record("PY", "repl", "input", "pool closed")
+
+
+def test_from_connection_starts_new_session(store, _schema_template):
+    """from_connection() wraps a cloned schema and registers its own session."""
+    assert [r["id"] for r in store.sessions()] == [store.session_id]
+    # The template itself never gains rows
+    assert _schema_template.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 0
+    store.record("PY", "repl", "input", "hello template")
+    assert store.search("template")[0]["content"] == "hello template"
+
+
 def test_record_persists_entry(store):
     """record() inserts a row with correct session_id, mode, channel, direction, content."""
     store.record("PY", "repl", "input", "x = 42")
@@ -52,11 +99,37 @@ def test_record_with_metadata(store):
     assert row["mtype"] == "expr_result"
 
 
+def test_record_many_persists_entries(store):
+    """record_many() inserts every row in order, with metadata and truncation."""
+    store.record_many([
+        ("PY", "repl", "input", "x = 42"),
+        ("PY", "repl", "output", "42", {"type": "expr_result"}),
+        ("PY", "repl", "output", "x" * 15_000),
+    ])
+    rows = store.session_entries()
+    assert [r["content"][:6] for r in rows] == ["x = 42", "42", "xxxxxx"]
+    assert json.loads(rows[1]["metadata"]) == {"type": "expr_result"}
+    assert len(rows[2]["content"]) == 10_000
+    assert json.loads(rows[2]["metadata"])["truncated"] is True
+
+
+def test_record_many_rolls_back_on_error(store):
+    """record_many() is all-or-nothing: a bad row leaves no entries behind."""
+    with pytest.raises(sqlite3.IntegrityError):
+        store.record_many([
+            ("PY", "repl", "input", "ok"),
+            ("PY", "repl", "sideways", "bad direction"),
+        ])
+    assert store.session_entries() == []
+
+
 def test_search_fts(store):
     """search() returns entries matching FTS5 MATCH query."""
-    store.record("PY", "repl", "input", "hello world")
-    store.record("PY", "repl", "input", "goodbye world")
-    store.record("PY", "repl", "input", "something else")
+    store.record_many([
+        ("PY", "repl", "input", "hello world"),
+        ("PY", "repl", "input", "goodbye world"),
+        ("PY", "repl", "input", "something else"),
+    ])
     results = store.search("hello")
     assert len(results) == 1
     assert results[0]["content"] == "hello world"
@@ -69,13 +142,13 @@ def test_search_returns_empty_for_no_match(store):
     assert results == []
 
 
-def test_recent_returns_latest(store):
+def test_recent_returns_latest(store, monkeypatch):
     """recent(n) returns the n most recent entries by timestamp descending."""
-    import time
+    # Deterministic, distinct timestamps 1..5 instead of sleeping between inserts
+    clock = itertools.count(1)
+    monkeypatch.setattr("bae.repl.store.time.time", lambda: float(next(clock)))
 
-    for i in range(5):
-        store.record("PY", "repl", "input", f"entry {i}")
-        time.sleep(0.01)  # ensure distinct timestamps
+    store.record_many([("PY", "repl", "input", f"entry {i}") for i in range(5)])
     results = store.recent(3)
     assert len(results) == 3
     # Most recent first
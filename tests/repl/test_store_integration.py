@@ -2,29 +2,20 @@
 
 from __future__ import annotations
 
-import json
 from unittest.mock import patch
 
 import pytest
 
 from bae.repl.bash import dispatch_bash
 from bae.repl.channels import CHANNEL_DEFAULTS, ChannelRouter, enable_debug, disable_debug
-from bae.repl.store import SessionStore
-
-
-@pytest.fixture
-def store(tmp_path):
-    """Create a SessionStore with a temporary database."""
-    s = SessionStore(tmp_path / "test.db")
-    yield s
-    s.close()
+from bae.repl.store import SessionStore, close_pool
 
 
 def test_py_mode_records_input_and_output(store):
     """PY mode input and expr_result output are recorded with correct fields."""
     store.record("PY", "repl", "input", "2 + 2")
     store.record("PY", "repl", "output", "4", {"type": "expr_result"})
-    entries = store.session_entries()
+    entries = store.session_entries(parse_metadata=True)
     assert len(entries) == 2
 
     inp = entries[0]
@@ -38,28 +29,27 @@ def test_py_mode_records_input_and_output(store):
     assert out["channel"] == "repl"
     assert out["direction"] == "output"
     assert out["content"] == "4"
-    meta = json.loads(out["metadata"])
-    assert meta["type"] == "expr_result"
+    assert out["metadata_type"] == "expr_result"
 
 
 def test_bash_mode_records_stdout_and_stderr(store):
     """BASH stdout and stderr are recorded as separate entries with stream metadata."""
     store.record("BASH", "stdout", "output", "file1.txt\nfile2.txt\n")
     store.record("BASH", "stderr", "output", "warning: something\n", {"type": "stderr"})
-    entries = store.session_entries()
+    entries = store.session_entries(parse_metadata=True)
     assert len(entries) == 2
 
     stdout_entry = entries[0]
     assert stdout_entry["mode"] == "BASH"
     assert stdout_entry["channel"] == "stdout"
     assert stdout_entry["direction"] == "output"
+    assert stdout_entry["metadata_type"] is None
 
     stderr_entry = entries[1]
     assert stderr_entry["mode"] == "BASH"
     assert stderr_entry["channel"] == "stderr"
     assert stderr_entry["direction"] == "output"
-    meta = json.loads(stderr_entry["metadata"])
-    assert meta["type"] == "stderr"
+    assert stderr_entry["metadata_type"] == "stderr"
 
 
 def test_nl_mode_records_stub(store):
@@ -76,9 +66,11 @@ def test_nl_mode_records_stub(store):
 
 def test_store_inspector_prints_session(store, capsys):
     """store() prints session ID and entry count, returns None."""
-    store.record("PY", "repl", "input", "x = 1")
-    store.record("PY", "repl", "output", "None")
-    store.record("PY", "repl", "input", "x + 1")
+    store.record_many([
+        ("PY", "repl", "input", "x = 1"),
+        ("PY", "repl", "output", "None"),
+        ("PY", "repl", "input", "x + 1"),
+    ])
     result = store()
     captured = capsys.readouterr()
     assert f"Session {store.session_id}: 3 entries" in captured.out
@@ -87,9 +79,11 @@ def test_store_inspector_prints_session(store, capsys):
 
 def test_store_inspector_search(store, capsys):
     """store('query') searches via FTS5 and prints canonical 3-field tags, returns None."""
-    store.record("PY", "repl", "input", "hello world")
-    store.record("PY", "repl", "input", "goodbye moon")
-    store.record("BASH", "stdout", "output", "hello again")
+    store.record_many([
+        ("PY", "repl", "input", "hello world"),
+        ("PY", "repl", "input", "goodbye moon"),
+        ("BASH", "stdout", "output", "hello again"),
+    ])
     result = store("hello")
     captured = capsys.readouterr()
     assert result is None
@@ -127,76 +121,87 @@ async def test_dispatch_bash_cd_returns_empty(tmp_path):
         os.chdir(original)
 
 
-def test_store_display_truncation_ellipsis(store, capsys):
+def test_store_display_truncation_ellipsis(store, captured_index):
     """store() display truncates long content with ellipsis marker."""
     store.record("PY", "repl", "input", "a" * 200)
     store()
-    captured = capsys.readouterr()
-    lines = captured.out.strip().split("\n")
-    # Entry line is indented (session display), find it
-    entry_line = [l for l in lines if "[PY:repl:input]" in l][0]
+    entry_line = captured_index()["PY:repl:input"]
     assert entry_line.rstrip().endswith("...")
-    assert "a" * 200 not in captured.out
+    assert "a" * 200 not in entry_line
 
 
-def test_store_search_display_truncation_ellipsis(store, capsys):
-    """store('query') display truncates long content with ellipsis marker."""
+def test_store_search_display_truncation_ellipsis(store, captured_index):
+    """store('query') display truncates long content to the line width with an ellipsis."""
     store.record("PY", "repl", "input", "findme " + "x" * 200)
     store("findme")
-    captured = capsys.readouterr()
-    assert "..." in captured.out
+    line = captured_index()["PY:repl:input"]
+    assert line.endswith("...")
+    assert len(line) == 80
+
+
+def test_format_entry_escapes_newlines_before_truncating(store):
+    """_format_entry escapes newlines and caps long content at max_width."""
+    entry = {"mode": "PY", "channel": "repl", "direction": "output"}
+    short = store._format_entry({**entry, "content": "a\nb"})
+    assert short == "[PY:repl:output] a\\nb"
+    long = store._format_entry({**entry, "content": "\n" * 5_000})
+    assert len(long) == 80
+    assert long.endswith("\\n...")
 
 
-def test_format_entry_consistency(store, capsys):
+def test_format_entry_consistency(store, captured_index):
     """store() uses canonical 3-field [mode:channel:direction] tags for all entries."""
-    store.record("PY", "repl", "input", "py input")
-    store.record("BASH", "stdout", "output", "bash output")
+    store.record_many([
+        ("PY", "repl", "input", "py input"),
+        ("BASH", "stdout", "output", "bash output"),
+    ])
     store()
-    captured = capsys.readouterr()
-    assert "[PY:repl:input]" in captured.out
-    assert "[BASH:stdout:output]" in captured.out
+    lines = captured_index()
+    assert lines["PY:repl:input"] == "[PY:repl:input] py input"
+    assert lines["BASH:stdout:output"] == "[BASH:stdout:output] bash output"
 
 
 def test_cross_session_persistence(tmp_path):
     """Multiple sessions on the same db file share data and are all visible."""
     db = tmp_path / "shared.db"
 
-    s1 = SessionStore(db)
+    s1 = SessionStore.from_pool(db)
     s1.record("PY", "repl", "input", "session one input")
     s1.close()
 
-    s2 = SessionStore(db)
+    s2 = SessionStore.from_pool(db)
     s2.record("BASH", "stdout", "output", "session two output")
     s2.close()
 
-    s3 = SessionStore(db)
+    s3 = SessionStore.from_pool(db)
     sessions = s3.sessions()
     assert len(sessions) == 3  # s1, s2, s3
+    assert len({s1.session_id, s2.session_id, s3.session_id}) == 3
 
     recent = s3.recent()
     contents = [r["content"] for r in recent]
     assert "session one input" in contents
     assert "session two output" in contents
     s3.close()
+    close_pool(db)
 
 
 # --- Channel integration tests ---
 
 
-def test_channel_output_in_store(tmp_path):
+def test_channel_output_in_store():
     """Channel.write() persists output to SessionStore with correct channel name."""
-    s = SessionStore(tmp_path / "ch.db")
+    s = SessionStore(":memory:")
     router = ChannelRouter()
     router.register("py", "#87ff87", store=s)
     router.write("py", "x = 42", mode="PY", metadata={"type": "expr_result"})
-    entries = s.session_entries()
+    entries = s.session_entries(parse_metadata=True)
     assert len(entries) == 1
     entry = entries[0]
     assert entry["mode"] == "PY"
     assert entry["channel"] == "py"
     assert entry["content"] == "x = 42"
-    meta = json.loads(entry["metadata"])
-    assert meta["type"] == "expr_result"
+    assert entry["metadata_type"] == "expr_result"
     s.close()
 
 
@@ -214,8 +219,7 @@ def test_channels_in_namespace(tmp_path):
 def test_channel_visibility_toggle():
     """Setting channel.visible=False excludes it from router.visible list."""
     router = ChannelRouter()
-    for name, cfg in CHANNEL_DEFAULTS.items():
-        router.register(name, cfg["color"])
+    router.register_defaults(CHANNEL_DEFAULTS)
     assert "bash" in router.visible
     router._channels["bash"].visible = False
     assert "bash" not in router.visible
@@ -224,7 +228,7 @@ def test_channel_visibility_toggle():
 
 def test_debug_logging_writes_file(tmp_path):
     """enable_debug routes channel writes to a debug log file."""
-    s = SessionStore(tmp_path / "dbg.db")
+    s = SessionStore(":memory:")
     router = ChannelRouter()
     router.register("py", "#87ff87", store=s)
     enable_debug(router, log_dir=tmp_path)
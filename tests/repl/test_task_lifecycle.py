@@ -3,44 +3,132 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from bae.repl.modes import Mode
+from bae.repl.ai import AI
+from bae.repl.bash import dispatch_bash
+from bae.repl.modes import DEFAULT_MODE, Mode
 from bae.repl.shell import CortexShell, _build_key_bindings, _print_task_menu
 from bae.repl.tasks import TaskManager
 from bae.repl.toolbar import TASKS_PER_PAGE, ToolbarConfig, render_task_menu
+from bae.repl.views import ViewMode
 
 
 # --- Fixtures ---
 
-@pytest.fixture
-def shell():
-    """A CortexShell constructed with mocked externals."""
-    with patch("bae.repl.shell.SessionStore"), \
-         patch("bae.repl.shell.PromptSession"), \
-         patch("bae.repl.shell.NamespaceCompleter"), \
-         patch("bae.lm.ClaudeCLIBackend"):
+# Never set: tasks parked on it stay RUNNING until revoked, with no timer
+# handles. Binds to the shared session event loop on first wait.
+_park_event = asyncio.Event()
+
+
+async def _park():
+    """Stand-in task body that runs until cancelled."""
+    await _park_event.wait()
+
+
+async def _drain(tm: TaskManager) -> None:
+    """Wait until every tracked task has actually finished (e.g. after revoke)."""
+    await asyncio.gather(*(tt.task for tt in tm._tasks.values()), return_exceptions=True)
+
+
+# Externals mocked out while the shared CortexShell is constructed
+_PATCH_TARGETS = (
+    "bae.repl.shell.SessionStore",
+    "bae.repl.shell.PromptSession",
+    "bae.repl.shell.NamespaceCompleter",
+    "bae.lm.ClaudeCLIBackend",
+)
+
+
+@pytest.fixture(scope="module")
+def _module_shell():
+    """A CortexShell constructed once per module with mocked externals."""
+    with contextlib.ExitStack() as stack:
+        for target in _PATCH_TARGETS:
+            stack.enter_context(patch(target))
         s = CortexShell()
     return s
 
 
+@pytest.fixture
+def shell(_module_shell):
+    """The shared CortexShell, restored to its constructed state after each test.
+
+    Reset in place rather than rebound: the AI sessions and the graph context
+    hold the shell's TaskManager and namespace objects themselves.
+    """
+    s = _module_shell
+    ai = s.ai
+    namespace = dict(s.namespace)
+    yield s
+    s.tm.revoke_all(graceful=False)
+    s.tm._tasks.clear()
+    s.tm._by_asyncio_task.clear()
+    s.tm._next_id = 1
+    s.namespace.clear()
+    s.namespace.update(namespace)
+    for label in [k for k in s._ai_sessions if k != "1"]:
+        del s._ai_sessions[label]
+    s._active_session = "1"
+    s.ai = ai
+    s._task_menu = False
+    s._task_menu_page = 0
+    s.mode = DEFAULT_MODE
+    s._set_view(ViewMode.USER)
+
+
+@pytest.fixture(scope="module")
+def kb_handlers(_module_shell):
+    """Key bindings for the shared shell, built once and indexed by key sequence.
+
+    Keys are tuples of key names, e.g. ("c-c",) or ("escape", "enter"). When
+    several bindings share a sequence, the first registered one wins.
+    """
+    kb = _build_key_bindings(_module_shell)
+    handlers = {}
+    for binding in kb.bindings:
+        handlers.setdefault(_key_names(binding), binding.handler)
+    return handlers
+
+
+def _key_names(binding) -> tuple[str, ...]:
+    """A binding's key sequence as plain names (Keys members carry theirs in .value)."""
+    return tuple(getattr(k, "value", k) for k in binding.keys)
+
+
+@pytest.fixture
+def pft_sink(monkeypatch):
+    """Record shell print_formatted_text calls instead of writing to the terminal."""
+    sink = []
+    monkeypatch.setattr(
+        "bae.repl.shell.print_formatted_text", lambda *args, **kwargs: sink.append(args),
+    )
+    return sink
+
+
+class _BGRecorder:
+    """app.create_background_task stand-in: records each coroutine and closes it unrun."""
+
+    __slots__ = ("_calls",)
+
+    def __init__(self) -> None:
+        self._calls = []
+
+    def __call__(self, coro) -> None:
+        self._calls.append(coro)
+        coro.close()
+
+
 def _mock_event(shell):
     """Build a mock prompt_toolkit event for key binding tests."""
     event = MagicMock()
     event.app.exit = MagicMock()
     event.app.invalidate = MagicMock()
     event.current_buffer.reset = MagicMock()
-
-    _calls = []
-
-    def _create_bg_task(coro):
-        _calls.append(coro)
-        coro.close()
-
-    event.app.create_background_task = _create_bg_task
-    event.app.create_background_task._calls = _calls
+    event.app.create_background_task = _BGRecorder()
     return event
 
 
@@ -52,10 +140,7 @@ class TestSubmit:
     @pytest.mark.asyncio
     async def test_submit_creates_tracked_task(self, shell):
         """tm.submit() returns TrackedTask with RUNNING state."""
-        async def noop():
-            await asyncio.sleep(10)
-
-        tt = shell.tm.submit(noop(), name="test:add", mode="nl")
+        tt = shell.tm.submit(_park(), name="test:add", mode="nl")
         assert tt.state.value == "running"
         assert len(shell.tm.active()) == 1
         shell.tm.revoke(tt.task_id)
@@ -78,10 +163,7 @@ class TestSubmit:
     @pytest.mark.asyncio
     async def test_submit_sets_name(self, shell):
         """TrackedTask.name matches what was passed to submit."""
-        async def noop():
-            await asyncio.sleep(10)
-
-        tt = shell.tm.submit(noop(), name="test:foo", mode="nl")
+        tt = shell.tm.submit(_park(), name="test:foo", mode="nl")
         assert tt.name == "test:foo"
         shell.tm.revoke(tt.task_id)
         try:
@@ -95,12 +177,11 @@ class TestSubmit:
 class TestInterruptHandler:
     """Ctrl-C key binding: exit, task menu, kill all."""
 
-    def test_ctrl_c_no_tasks_exits(self, shell):
+    def test_ctrl_c_no_tasks_exits(self, shell, kb_handlers):
         """Ctrl-C with no tasks exits the REPL."""
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "c-c")
+        handler = kb_handlers[("c-c",)]
         handler(event)
 
         event.app.exit.assert_called_once()
@@ -109,17 +190,13 @@ class TestInterruptHandler:
                isinstance(kwargs.get("exception"), KeyboardInterrupt)
 
     @pytest.mark.asyncio
-    async def test_ctrl_c_opens_task_menu(self, shell):
+    async def test_ctrl_c_opens_task_menu(self, shell, kb_handlers):
         """Ctrl-C with running tasks sets _task_menu = True."""
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        shell.tm.submit(sleepy(), name="t1", mode="nl")
+        shell.tm.submit(_park(), name="t1", mode="nl")
 
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "c-c")
+        handler = kb_handlers[("c-c",)]
         handler(event)
 
         assert shell._task_menu is True
@@ -127,29 +204,25 @@ class TestInterruptHandler:
 
         # cleanup
         shell.tm.revoke_all(graceful=False)
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
     @pytest.mark.asyncio
-    async def test_ctrl_c_in_menu_kills_all(self, shell):
+    async def test_ctrl_c_in_menu_kills_all(self, shell, kb_handlers):
         """Ctrl-C while task menu open calls tm.revoke_all() and closes menu."""
-        async def sleepy():
-            await asyncio.sleep(100)
+        shell.tm.submit(_park(), name="t1", mode="nl")
+        shell.tm.submit(_park(), name="t2", mode="nl")
 
-        shell.tm.submit(sleepy(), name="t1", mode="nl")
-        shell.tm.submit(sleepy(), name="t2", mode="nl")
-
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
         # Open task menu first
         shell._task_menu = True
 
-        handler = _get_handler(kb, "c-c")
+        handler = kb_handlers[("c-c",)]
         handler(event)
 
         assert shell._task_menu is False
         assert len(shell.tm.active()) == 0
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
 
 # --- TestTaskMenu ---
@@ -172,60 +245,50 @@ class TestTaskMenu:
         assert len(result) > 0
 
     @pytest.mark.asyncio
-    async def test_digit_cancels_task(self, shell):
+    async def test_digit_cancels_task(self, shell, kb_handlers):
         """With task menu open, digit '1' cancels the first task."""
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        tt = shell.tm.submit(sleepy(), name="target", mode="nl")
+        tt = shell.tm.submit(_park(), name="target", mode="nl")
         shell._task_menu = True
 
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "1")
+        handler = kb_handlers[("1",)]
         handler(event)
 
         assert tt.state.value == "revoked"
         # Menu auto-closes when no tasks left
         assert shell._task_menu is False
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
     @pytest.mark.asyncio
-    async def test_esc_dismisses_menu(self, shell):
+    async def test_esc_dismisses_menu(self, shell, kb_handlers):
         """Esc closes task menu, returns to normal toolbar."""
         shell._task_menu = True
 
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "escape")
+        handler = kb_handlers[("escape",)]
         handler(event)
 
         assert shell._task_menu is False
 
     @pytest.mark.asyncio
-    async def test_pagination_left_right(self, shell):
+    async def test_pagination_left_right(self, shell, kb_handlers):
         """With >5 tasks, right increments page, left decrements."""
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        for i in range(7):
-            shell.tm.submit(sleepy(), name=f"t{i}", mode="nl")
+        shell.tm.submit_many([(_park(), f"t{i}", "nl") for i in range(7)])
 
         shell._task_menu = True
         shell._task_menu_page = 0
 
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
         # Right arrow -> page 1
-        right_handler = _get_handler(kb, "right")
+        right_handler = kb_handlers[("right",)]
         right_handler(event)
         assert shell._task_menu_page == 1
 
         # Left arrow -> page 0
-        left_handler = _get_handler(kb, "left")
+        left_handler = kb_handlers[("left",)]
         left_handler(event)
         assert shell._task_menu_page == 0
 
@@ -235,73 +298,61 @@ class TestTaskMenu:
 
         # cleanup
         shell.tm.revoke_all(graceful=False)
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
     @pytest.mark.asyncio
-    @patch("bae.repl.shell.print_formatted_text")
-    async def test_ctrl_c_prints_task_list_to_scrollback(self, mock_pft, shell):
+    async def test_ctrl_c_prints_task_list_to_scrollback(self, pft_sink, shell, kb_handlers):
         """Ctrl-C with tasks prints numbered list to scrollback via _print_task_menu."""
-        async def sleepy():
-            await asyncio.sleep(100)
+        shell.tm.submit(_park(), name="alpha", mode="nl")
+        shell.tm.submit(_park(), name="beta", mode="nl")
 
-        shell.tm.submit(sleepy(), name="alpha", mode="nl")
-        shell.tm.submit(sleepy(), name="beta", mode="nl")
-
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "c-c")
+        before = len(pft_sink)
+        handler = kb_handlers[("c-c",)]
         handler(event)
 
         # _print_task_menu prints 2 task lines + 1 hint = 3 calls
-        assert mock_pft.call_count == 3
+        assert len(pft_sink) - before == 3
         assert shell._task_menu is True
 
         shell.tm.revoke_all(graceful=False)
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
     @pytest.mark.asyncio
-    @patch("bae.repl.shell.print_formatted_text")
-    async def test_digit_cancel_reprints_remaining(self, mock_pft, shell):
+    async def test_digit_cancel_reprints_remaining(self, pft_sink, shell, kb_handlers):
         """After cancelling a task, remaining tasks are reprinted to scrollback."""
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        shell.tm.submit(sleepy(), name="first", mode="nl")
-        shell.tm.submit(sleepy(), name="second", mode="nl")
+        shell.tm.submit(_park(), name="first", mode="nl")
+        shell.tm.submit(_park(), name="second", mode="nl")
         shell._task_menu = True
 
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "1")
+        before = len(pft_sink)
+        handler = kb_handlers[("1",)]
         handler(event)
 
         # One task cancelled, one remaining -> reprinted (1 task line + 1 hint = 2 calls)
-        assert mock_pft.call_count == 2
+        assert len(pft_sink) - before == 2
         assert shell._task_menu is True  # still open, one task left
 
         shell.tm.revoke_all(graceful=False)
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
     @pytest.mark.asyncio
-    async def test_menu_closes_when_empty(self, shell):
+    async def test_menu_closes_when_empty(self, shell, kb_handlers):
         """After cancelling last task, _task_menu auto-closes."""
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        shell.tm.submit(sleepy(), name="only", mode="nl")
+        shell.tm.submit(_park(), name="only", mode="nl")
         shell._task_menu = True
 
-        kb = _build_key_bindings(shell)
         event = _mock_event(shell)
 
-        handler = _get_handler(kb, "1")
+        handler = kb_handlers[("1",)]
         handler(event)
 
         assert shell._task_menu is False
         assert len(shell.tm.active()) == 0
-        await asyncio.sleep(0)
+        await _drain(shell.tm)
 
 
 # --- TestBackgroundDispatch ---
@@ -312,11 +363,9 @@ class TestBackgroundDispatch:
     @pytest.mark.asyncio
     async def test_dispatch_nl_returns_immediately(self, shell):
         """NL dispatch creates tracked task and returns without awaiting it."""
-        started = asyncio.Event()
         hold = asyncio.Event()
 
         async def slow_ai(prompt):
-            started.set()
             await hold.wait()
 
         shell.ai = slow_ai
@@ -387,18 +436,21 @@ class TestBackgroundDispatch:
 
 # --- TestSubprocessCleanup ---
 
+def _cancelled_future() -> asyncio.Future:
+    """communicate() stand-in: an already-cancelled future, no AsyncMock frames."""
+    f = asyncio.get_running_loop().create_future()
+    f.set_exception(asyncio.CancelledError())
+    return f
+
+
 class TestSubprocessCleanup:
     """CancelledError kills child processes instead of orphaning them."""
 
     @pytest.mark.asyncio
-    async def test_ai_kills_process_on_cancel(self):
+    async def test_ai_kills_process_on_cancel(self, fake_proc):
         """AI.__call__ kills subprocess when cancelled."""
-        from bae.repl.ai import AI
-
-        mock_proc = AsyncMock()
-        mock_proc.communicate = AsyncMock(side_effect=asyncio.CancelledError)
-        mock_proc.kill = MagicMock()
-        mock_proc.wait = AsyncMock()
+        mock_proc = fake_proc
+        mock_proc.communicate = _cancelled_future
 
         router = MagicMock()
         ns = {}
@@ -408,17 +460,15 @@ class TestSubprocessCleanup:
             task = asyncio.create_task(ai("test"))
             await asyncio.sleep(0)
             task.cancel()
-            with pytest.raises(asyncio.CancelledError):
-                await task
+            (result,) = await asyncio.gather(task, return_exceptions=True)
+            assert isinstance(result, asyncio.CancelledError)
 
         mock_proc.kill.assert_called()
 
     @pytest.mark.asyncio
-    async def test_ai_cancellation_checkpoint(self):
+    async def test_ai_cancellation_checkpoint(self, fake_proc):
         """AI response suppressed when task cancelled during subprocess completion race."""
-        from bae.repl.ai import AI
-
-        mock_proc = AsyncMock()
+        mock_proc = fake_proc
         mock_proc.communicate = AsyncMock(return_value=(b"response text", b""))
         mock_proc.returncode = 0
 
@@ -430,30 +480,26 @@ class TestSubprocessCleanup:
             task = asyncio.create_task(ai("test"))
             await asyncio.sleep(0)
             task.cancel()
-            with pytest.raises(asyncio.CancelledError):
-                await task
+            (result,) = await asyncio.gather(task, return_exceptions=True)
+            assert isinstance(result, asyncio.CancelledError)
 
-        for call in router.write.call_args_list:
-            _, kwargs = call
-            meta = kwargs.get("metadata", {})
-            assert meta.get("type") != "response", "Response was written despite cancellation"
+        types_written = {
+            c.kwargs.get("metadata", {}).get("type") for c in router.write.call_args_list
+        }
+        assert "response" not in types_written, "Response was written despite cancellation"
 
     @pytest.mark.asyncio
-    async def test_bash_kills_process_on_cancel(self):
+    async def test_bash_kills_process_on_cancel(self, fake_proc):
         """dispatch_bash kills subprocess when cancelled."""
-        from bae.repl.bash import dispatch_bash
-
-        mock_proc = AsyncMock()
-        mock_proc.communicate = AsyncMock(side_effect=asyncio.CancelledError)
-        mock_proc.kill = MagicMock()
-        mock_proc.wait = AsyncMock()
+        mock_proc = fake_proc
+        mock_proc.communicate = _cancelled_future
 
         with patch("bae.repl.bash.asyncio.create_subprocess_shell", return_value=mock_proc):
             task = asyncio.create_task(dispatch_bash("sleep 100"))
             await asyncio.sleep(0)
             task.cancel()
-            with pytest.raises(asyncio.CancelledError):
-                await task
+            (result,) = await asyncio.gather(task, return_exceptions=True)
+            assert isinstance(result, asyncio.CancelledError)
 
         mock_proc.kill.assert_called()
 
@@ -481,6 +527,7 @@ class TestShellToolbar:
     def test_shell_has_task_manager(self, shell):
         """shell.tm is a TaskManager instance."""
         assert isinstance(shell.tm, TaskManager)
+        assert shell.ai._tm is shell.tm
         assert hasattr(shell, '_task_menu')
         assert hasattr(shell, '_task_menu_page')
 
@@ -501,11 +548,8 @@ class TestRenderTaskMenu:
     async def test_renders_task_names(self):
         """Active tasks appear as numbered list."""
         tm = TaskManager()
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        tm.submit(sleepy(), name="alpha", mode="nl")
-        tm.submit(sleepy(), name="beta", mode="nl")
+        tm.submit(_park(), name="alpha", mode="nl")
+        tm.submit(_park(), name="beta", mode="nl")
 
         result = render_task_menu(tm)
         texts = " ".join(text for _, text in result)
@@ -515,36 +559,17 @@ class TestRenderTaskMenu:
         assert "beta" in texts
 
         tm.revoke_all(graceful=False)
-        await asyncio.sleep(0)
+        await _drain(tm)
 
     @pytest.mark.asyncio
     async def test_pagination_indicator(self):
         """More than TASKS_PER_PAGE tasks shows pagination indicator."""
         tm = TaskManager()
-        async def sleepy():
-            await asyncio.sleep(100)
-
-        for i in range(7):
-            tm.submit(sleepy(), name=f"t{i}", mode="nl")
+        tm.submit_many([(_park(), f"t{i}", "nl") for i in range(7)])
 
         result = render_task_menu(tm, page=0)
         texts = " ".join(text for _, text in result)
         assert "1/2" in texts
 
         tm.revoke_all(graceful=False)
-        await asyncio.sleep(0)
-
-
-# --- Helpers ---
-
-def _get_handler(kb, key):
-    """Extract the handler for a single-key binding from a KeyBindings object.
-
-    Matches bindings where the entire key sequence is exactly [key].
-    For multi-key sequences like ("escape", "enter"), use the full tuple.
-    """
-    for binding in kb.bindings:
-        keys = [k.value if hasattr(k, 'value') else str(k) for k in binding.keys]
-        if keys == [key]:
-            return binding.handler
-    raise ValueError(f"No binding for {key!r}")
+        await _drain(tm)
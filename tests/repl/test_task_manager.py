@@ -4,20 +4,49 @@ from __future__ import annotations
 
 import asyncio
 import signal
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-from bae.repl.tasks import TaskManager, TaskState, TrackedTask
-
+from bae.repl.tasks import TaskManager, TaskState, TrackedTask, _current_tt
 
 # --- Fixtures ---
 
+# Never set: tasks parked on it run until cancelled, with no timer handles.
+_park_event = asyncio.Event()
+
+
+async def _park():
+    """Stand-in task body that runs until cancelled."""
+    await _park_event.wait()
+
+
+async def _returns(value):
+    return value
+
+
+async def _raises(exc: Exception):
+    raise exc
+
+
+async def _cancels_self():
+    """Cancel the running task via Task.cancel(), as revoke() would."""
+    asyncio.current_task().cancel()
+    await asyncio.sleep(0)
+
+
 @pytest.fixture
 def tm():
     return TaskManager()
 
 
+async def _cancel_all(tts: list[TrackedTask]) -> None:
+    """Cancel the tasks and wait for all of them in a single gather."""
+    for tt in tts:
+        tt.task.cancel()
+    await asyncio.gather(*(tt.task for tt in tts), return_exceptions=True)
+
+
 # --- TestSubmit ---
 
 class TestSubmit:
@@ -26,74 +55,61 @@ class TestSubmit:
     @pytest.mark.asyncio
     async def test_submit_returns_tracked_task(self, tm):
         """submit() wraps coroutine in TrackedTask with RUNNING state."""
-        async def noop():
-            await asyncio.sleep(10)
-
-        tt = tm.submit(noop(), name="test:sub", mode="nl")
+        tt = tm.submit(_park(), name="test:sub", mode="nl")
         assert isinstance(tt, TrackedTask)
         assert tt.state == TaskState.RUNNING
         assert tt.name == "test:sub"
         assert tt.mode == "nl"
         assert tt.task_id == 1
-        tt.task.cancel()
-        try:
-            await tt.task
-        except asyncio.CancelledError:
-            pass
+        await _cancel_all([tt])
 
     @pytest.mark.asyncio
     async def test_submit_auto_increments_id(self, tm):
         """Each submit() gets a unique, incrementing task_id."""
-        async def noop():
-            await asyncio.sleep(10)
-
-        tt1 = tm.submit(noop(), name="a", mode="nl")
-        tt2 = tm.submit(noop(), name="b", mode="bash")
+        tt1 = tm.submit(_park(), name="a", mode="nl")
+        tt2 = tm.submit(_park(), name="b", mode="bash")
         assert tt1.task_id == 1
         assert tt2.task_id == 2
-        for tt in [tt1, tt2]:
-            tt.task.cancel()
-            try:
-                await tt.task
-            except asyncio.CancelledError:
-                pass
+        await _cancel_all([tt1, tt2])
 
     @pytest.mark.asyncio
-    async def test_done_callback_success(self, tm):
-        """Task completing normally transitions state to SUCCESS."""
-        async def quick():
-            return 42
-
-        tt = tm.submit(quick(), name="ok", mode="nl")
-        await tt.task
-        assert tt.state == TaskState.SUCCESS
+    async def test_submit_many_tracks_batch(self, tm):
+        """submit_many() tracks every item with consecutive ids after earlier submits."""
+        first = tm.submit(_park(), name="a", mode="nl")
+        batch = tm.submit_many([(_park(), "b", "bash"), (_park(), "c", "py")])
+        assert [tt.task_id for tt in batch] == [2, 3]
+        assert [(tt.name, tt.mode) for tt in batch] == [("b", "bash"), ("c", "py")]
+        assert tm.active() == [first, *batch]
+        tm.revoke_all()
+        await _cancel_all([first, *batch])
+        assert all(tt.state == TaskState.REVOKED for tt in [first, *batch])
 
     @pytest.mark.asyncio
-    async def test_done_callback_failure(self, tm):
-        """Task raising exception transitions state to FAILURE."""
-        async def bad():
-            raise ValueError("boom")
-
-        tt = tm.submit(bad(), name="err", mode="nl")
-        try:
-            await tt.task
-        except ValueError:
-            pass
-        assert tt.state == TaskState.FAILURE
+    async def test_submit_many_tracks_tasks_started_before_a_failure(self, tm):
+        """If a later item can't start, earlier tasks are still tracked and revocable."""
+        with pytest.raises(TypeError):
+            tm.submit_many([(_park(), "a", "nl"), (None, "b", "nl")])
+        [started] = tm.active()
+        assert started.name == "a"
+        tm.revoke_all()
+        await _cancel_all([started])
+        assert started.state == TaskState.REVOKED
 
     @pytest.mark.asyncio
-    async def test_done_callback_revoked(self, tm):
-        """Task cancelled via cancel() transitions state to REVOKED."""
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt = tm.submit(slow(), name="rev", mode="nl")
-        tt.task.cancel()
-        try:
-            await tt.task
-        except asyncio.CancelledError:
-            pass
-        assert tt.state == TaskState.REVOKED
+    @pytest.mark.parametrize(
+        "coro_factory, expected_state",
+        [
+            (lambda: _returns(42), TaskState.SUCCESS),
+            (lambda: _raises(ValueError("boom")), TaskState.FAILURE),
+            (_cancels_self, TaskState.REVOKED),
+        ],
+        ids=["success", "failure", "revoked"],
+    )
+    async def test_done_callback_sets_state(self, tm, coro_factory, expected_state):
+        """Task outcome (return, raise, cancel()) sets the final TaskState."""
+        tt = tm.submit(coro_factory(), name="done", mode="nl")
+        await asyncio.gather(tt.task, return_exceptions=True)
+        assert tt.state == expected_state
 
 
 # --- TestRegisterProcess ---
@@ -102,16 +118,15 @@ class TestRegisterProcess:
     """TaskManager.register_process: associate subprocess with current asyncio.Task."""
 
     @pytest.mark.asyncio
-    async def test_register_process_associates(self, tm):
+    async def test_register_process_associates(self, tm, fake_proc):
         """register_process() from inside a running task sets tt.process."""
-        proc = MagicMock()
+        proc = fake_proc
         captured = {}
 
         async def worker():
             tm.register_process(proc)
             # Verify it was set
-            current = asyncio.current_task()
-            captured["process"] = tm._by_asyncio_task[current].process
+            captured["process"] = _current_tt.get().process
 
         tt = tm.submit(worker(), name="proc", mode="bash")
         await tt.task
@@ -119,9 +134,22 @@ class TestRegisterProcess:
         assert tt.process is proc
 
     @pytest.mark.asyncio
-    async def test_register_process_noop_for_untracked(self, tm):
+    async def test_register_process_ignores_child_tasks(self, tm, fake_proc):
+        """A task spawned inside a tracked task inherits its context but not its process."""
+        async def worker():
+            await asyncio.create_task(_register())
+
+        async def _register():
+            tm.register_process(fake_proc)
+
+        tt = tm.submit(worker(), name="proc", mode="bash")
+        await tt.task
+        assert tt.process is None
+
+    @pytest.mark.asyncio
+    async def test_register_process_noop_for_untracked(self, tm, fake_proc):
         """register_process() is a no-op if current task is not tracked."""
-        proc = MagicMock()
+        proc = fake_proc
         # Call from outside any tracked task -- should not raise
         tm.register_process(proc)
 
@@ -134,10 +162,7 @@ class TestRevoke:
     @pytest.mark.asyncio
     async def test_revoke_cancels_task(self, tm):
         """revoke() cancels the asyncio.Task and sets state to REVOKED."""
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt = tm.submit(slow(), name="rev", mode="nl")
+        tt = tm.submit(_park(), name="rev", mode="nl")
         tm.revoke(tt.task_id)
         assert tt.state == TaskState.REVOKED
         assert tt.task.cancelling()
@@ -148,46 +173,19 @@ class TestRevoke:
         assert tt.task.cancelled()
 
     @pytest.mark.asyncio
-    async def test_revoke_kills_process_graceful(self, tm):
-        """revoke(graceful=True) sends SIGTERM to process group."""
-        proc = MagicMock()
-        proc.pid = 12345
-        proc.returncode = None
-
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt = tm.submit(slow(), name="rev", mode="bash")
-        tt.process = proc
+    @pytest.mark.parametrize(
+        "graceful, expected_sig", [(True, signal.SIGTERM), (False, signal.SIGKILL)],
+    )
+    async def test_revoke_kills_process(self, tm, fake_proc, graceful, expected_sig):
+        """revoke() sends SIGTERM to the process group if graceful, else SIGKILL."""
+        tt = tm.submit(_park(), name="rev", mode="bash")
+        tt.process = fake_proc
 
         with patch("bae.repl.tasks.os.getpgid", return_value=12345) as mock_getpgid, \
              patch("bae.repl.tasks.os.killpg") as mock_killpg:
-            tm.revoke(tt.task_id, graceful=True)
+            tm.revoke(tt.task_id, graceful=graceful)
             mock_getpgid.assert_called_once_with(12345)
-            mock_killpg.assert_called_once_with(12345, signal.SIGTERM)
-
-        try:
-            await tt.task
-        except asyncio.CancelledError:
-            pass
-
-    @pytest.mark.asyncio
-    async def test_revoke_kills_process_non_graceful(self, tm):
-        """revoke(graceful=False) sends SIGKILL to process group."""
-        proc = MagicMock()
-        proc.pid = 12345
-        proc.returncode = None
-
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt = tm.submit(slow(), name="rev", mode="bash")
-        tt.process = proc
-
-        with patch("bae.repl.tasks.os.getpgid", return_value=12345) as mock_getpgid, \
-             patch("bae.repl.tasks.os.killpg") as mock_killpg:
-            tm.revoke(tt.task_id, graceful=False)
-            mock_killpg.assert_called_once_with(12345, signal.SIGKILL)
+            mock_killpg.assert_called_once_with(12345, expected_sig)
 
         try:
             await tt.task
@@ -197,10 +195,7 @@ class TestRevoke:
     @pytest.mark.asyncio
     async def test_revoke_no_process_just_cancels(self, tm):
         """revoke() with no associated process just cancels the task."""
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt = tm.submit(slow(), name="rev", mode="nl")
+        tt = tm.submit(_park(), name="rev", mode="nl")
         assert tt.process is None
         tm.revoke(tt.task_id)
         assert tt.state == TaskState.REVOKED
@@ -210,16 +205,11 @@ class TestRevoke:
             pass
 
     @pytest.mark.asyncio
-    async def test_revoke_dead_process_no_error(self, tm):
+    async def test_revoke_dead_process_no_error(self, tm, fake_proc):
         """revoke() handles already-dead process gracefully."""
-        proc = MagicMock()
-        proc.pid = 12345
-        proc.returncode = None
+        proc = fake_proc
 
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt = tm.submit(slow(), name="rev", mode="bash")
+        tt = tm.submit(_park(), name="rev", mode="bash")
         tt.process = proc
 
         with patch("bae.repl.tasks.os.getpgid", side_effect=ProcessLookupError):
@@ -256,20 +246,13 @@ class TestRevokeAll:
     @pytest.mark.asyncio
     async def test_revoke_all_kills_all_active(self, tm):
         """revoke_all() revokes every active task."""
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt1 = tm.submit(slow(), name="a", mode="nl")
-        tt2 = tm.submit(slow(), name="b", mode="bash")
+        tt1 = tm.submit(_park(), name="a", mode="nl")
+        tt2 = tm.submit(_park(), name="b", mode="bash")
         tm.revoke_all(graceful=False)
 
         assert tt1.state == TaskState.REVOKED
         assert tt2.state == TaskState.REVOKED
-        for tt in [tt1, tt2]:
-            try:
-                await tt.task
-            except asyncio.CancelledError:
-                pass
+        await _cancel_all([tt1, tt2])
 
 
 # --- TestActive ---
@@ -280,44 +263,29 @@ class TestActive:
     @pytest.mark.asyncio
     async def test_active_returns_running_only(self, tm):
         """active() returns only tasks in RUNNING state."""
-        async def slow():
-            await asyncio.sleep(100)
-
         async def quick():
             return 1
 
-        tt_slow = tm.submit(slow(), name="slow", mode="nl")
+        tt_slow = tm.submit(_park(), name="slow", mode="nl")
         tt_quick = tm.submit(quick(), name="quick", mode="nl")
         await tt_quick.task  # Completes -> SUCCESS
 
         active = tm.active()
         assert len(active) == 1
         assert active[0] is tt_slow
-        tt_slow.task.cancel()
-        try:
-            await tt_slow.task
-        except asyncio.CancelledError:
-            pass
+        await _cancel_all([tt_slow])
 
     @pytest.mark.asyncio
     async def test_active_sorted_by_id(self, tm):
         """active() returns tasks in task_id order."""
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt1 = tm.submit(slow(), name="first", mode="nl")
-        tt2 = tm.submit(slow(), name="second", mode="bash")
-        tt3 = tm.submit(slow(), name="third", mode="py")
+        tt1 = tm.submit(_park(), name="first", mode="nl")
+        tt2 = tm.submit(_park(), name="second", mode="bash")
+        tt3 = tm.submit(_park(), name="third", mode="py")
 
         active = tm.active()
         assert [tt.task_id for tt in active] == [1, 2, 3]
 
-        for tt in [tt1, tt2, tt3]:
-            tt.task.cancel()
-            try:
-                await tt.task
-            except asyncio.CancelledError:
-                pass
+        await _cancel_all([tt1, tt2, tt3])
 
     @pytest.mark.asyncio
     async def test_active_empty_when_all_done(self, tm):
@@ -338,11 +306,8 @@ class TestShutdown:
     @pytest.mark.asyncio
     async def test_shutdown_revokes_and_awaits(self, tm):
         """shutdown() revokes all tasks gracefully and awaits completion."""
-        async def slow():
-            await asyncio.sleep(100)
-
-        tt1 = tm.submit(slow(), name="a", mode="nl")
-        tt2 = tm.submit(slow(), name="b", mode="bash")
+        tt1 = tm.submit(_park(), name="a", mode="nl")
+        tt2 = tm.submit(_park(), name="b", mode="bash")
         await tm.shutdown()
 
         assert tt1.state == TaskState.REVOKED
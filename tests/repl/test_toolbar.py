@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from bae.repl.toolbar import (
+    _RSS_PER_MB,
     ToolbarConfig,
     make_cwd_widget,
     make_gates_widget,
@@ -70,6 +73,53 @@ class TestToolbarConfig:
         result = cfg.render()
         assert result == [("fg:red", " [bad:err] ")]
 
+    def test_render_reuses_keyed_widget_until_key_changes(self):
+        cfg = ToolbarConfig()
+        state = {"mode": "PY", "calls": 0}
+
+        def widget():
+            state["calls"] += 1
+            return [("", state["mode"])]
+
+        cfg.add("mode", widget, key_fn=lambda: state["mode"])
+        first = cfg.render()
+        assert cfg.render() == [("", "PY")]
+        assert cfg.render() is cfg.render()  # all widgets keyed: flat list reused
+        assert state["calls"] == 1
+        state["mode"] = "NL"
+        assert cfg.render() == [("", "NL")]
+        assert state["calls"] == 2
+        assert first == [("", "PY")]
+
+    def test_render_unkeyed_widget_always_called(self):
+        cfg = ToolbarConfig()
+        calls = []
+        cfg.add("k", lambda: [("", "k")], key_fn=lambda: 1)
+        cfg.add("u", lambda: calls.append(1) or [("", "u")])
+        cfg.render()
+        assert cfg.render() == [("", "k"), ("", "u")]
+        assert len(calls) == 2
+
+    def test_render_keyed_exception_cached(self):
+        cfg = ToolbarConfig()
+        calls = []
+
+        def bad():
+            calls.append(1)
+            raise ValueError("boom")
+
+        cfg.add("bad", bad, key_fn=lambda: 0)
+        assert cfg.render() == [("fg:red", " [bad:err] ")]
+        assert cfg.render() == [("fg:red", " [bad:err] ")]
+        assert len(calls) == 1
+
+    def test_add_replacing_drops_cached_render(self):
+        cfg = ToolbarConfig()
+        cfg.add("x", lambda: [("", "a")], key_fn=lambda: 0)
+        cfg.render()
+        cfg.add("x", lambda: [("", "b")], key_fn=lambda: 0)
+        assert cfg.render() == [("", "b")]
+
     def test_render_empty(self):
         cfg = ToolbarConfig()
         assert cfg.render() == []
@@ -120,10 +170,21 @@ class TestBuiltinWidgets:
         assert widget() == [("class:toolbar.tasks", " 1 task ")]
 
     def test_make_cwd_widget(self):
-        widget = make_cwd_widget()
+        # The home prefix is resolved when the widget is built.
+        make_cwd_widget.cache_clear()
         with patch("bae.repl.toolbar.os.getcwd", return_value="/Users/dz/lab/bae"), \
              patch("bae.repl.toolbar.os.path.expanduser", return_value="/Users/dz"):
+            widget = make_cwd_widget()
             assert widget() == [("class:toolbar.cwd", " ~/lab/bae ")]
+        make_cwd_widget.cache_clear()
+
+    def test_make_cwd_widget_reuses_fragments_until_chdir(self):
+        widget = make_cwd_widget()
+        with patch("bae.repl.toolbar.os.getcwd", return_value="/srv/a"):
+            first = widget()
+            assert widget() is first
+        with patch("bae.repl.toolbar.os.getcwd", return_value="/srv/b"):
+            assert widget() == [("class:toolbar.cwd", " /srv/b ")]
 
     def test_make_view_widget_hidden_in_user_mode(self):
         shell = MagicMock()
@@ -131,17 +192,12 @@ class TestBuiltinWidgets:
         widget = make_view_widget(shell)
         assert widget() == []
 
-    def test_make_view_widget_shows_debug(self):
+    @pytest.mark.parametrize("view", ["debug", "ai-self"])
+    def test_make_view_widget_shows_view(self, view):
         shell = MagicMock()
-        shell.view_mode.value = "debug"
+        shell.view_mode.value = view
         widget = make_view_widget(shell)
-        assert widget() == [("class:toolbar.view", " debug ")]
-
-    def test_make_view_widget_shows_ai_self(self):
-        shell = MagicMock()
-        shell.view_mode.value = "ai-self"
-        widget = make_view_widget(shell)
-        assert widget() == [("class:toolbar.view", " ai-self ")]
+        assert widget() == [("class:toolbar.view", f" {view} ")]
 
     def test_make_gates_widget_hidden_when_zero(self):
         shell = MagicMock()
@@ -149,17 +205,17 @@ class TestBuiltinWidgets:
         widget = make_gates_widget(shell)
         assert widget() == []
 
-    def test_make_gates_widget_shows_count(self):
+    @pytest.mark.parametrize("count, text", [(3, " 3 gates "), (1, " 1 gate ")])
+    def test_make_gates_widget_shows_count(self, count, text):
         shell = MagicMock()
-        shell.engine.pending_gate_count.return_value = 3
+        shell.engine.pending_gate_count.return_value = count
         widget = make_gates_widget(shell)
-        assert widget() == [("class:toolbar.gates", " 3 gates ")]
+        assert widget() == [("class:toolbar.gates", text)]
 
-    def test_make_gates_widget_singular(self):
-        shell = MagicMock()
-        shell.engine.pending_gate_count.return_value = 1
-        widget = make_gates_widget(shell)
-        assert widget() == [("class:toolbar.gates", " 1 gate ")]
+    def test_stateless_widgets_shared(self):
+        """Factories that don't take a shell build their widget once."""
+        assert make_cwd_widget() is make_cwd_widget()
+        assert make_mem_widget() is make_mem_widget()
 
     def test_make_mem_widget(self):
         widget = make_mem_widget()
@@ -171,3 +227,10 @@ class TestBuiltinWidgets:
         # Should parse as a positive number
         mb = int(text.strip().rstrip("M"))
         assert mb > 0
+
+    def test_make_mem_widget_scales_rss(self):
+        """The widget renders ru_maxrss in whole MiB for the platform's unit."""
+        widget = make_mem_widget()
+        usage = MagicMock(ru_maxrss=300 * _RSS_PER_MB)
+        with patch("bae.repl.toolbar.resource.getrusage", return_value=usage):
+            assert widget() == [("class:toolbar.mem", " 300M ")]
@@ -156,6 +156,15 @@ def test_rich_to_ansi_uses_terminal_width(mock_size):
         assert len(clean) <= 40
 
 
+def test_rich_to_ansi_width_per_call():
+    """Successive renders each honour their own width."""
+    text = Text("word " * 30)
+    narrow = _rich_to_ansi(text, width=20)
+    wide = _rich_to_ansi(text, width=100)
+    assert len(narrow.splitlines()) > len(wide.splitlines())
+    assert _rich_to_ansi(text, width=20) == narrow
+
+
 # --- Tool call display tests ---
 
 
@@ -239,6 +248,13 @@ def test_tool_summary_glob():
     assert result == "◆ glob(src/*.py) -> str (3 matches)"
 
 
+def test_tool_summary_grep_trailing_newline():
+    """A trailing newline does not count as an extra match; '(no matches)' counts 0."""
+    output = "a.py:1:foo\nb.py:2:foo\n"
+    assert _tool_summary("<Grep:foo>", output) == "◆ grep(foo) -> str (2 matches)"
+    assert _tool_summary("<Grep:foo>", "(no matches)") == "◆ grep(foo) -> str (0 matches)"
+
+
 def test_tool_summary_write():
     """_tool_summary generates diamond-bullet 'write(path) -> str' for Write tags."""
     output = "Wrote 42 chars to foo.py"
@@ -269,21 +285,50 @@ def test_debug_view_no_metadata(mock_pft):
     view.render("py", "#87ff87", "hello", metadata=None)
     header_call = mock_pft.call_args_list[0]
     header_ft = header_call[0][0]
-    header_text = "".join(text for _, text in header_ft)
+    header_text = "".join(text for _, text in header_ft).split("\n")[0]
     assert header_text == "[py]"
 
 
 @patch("bae.repl.views.print_formatted_text")
 def test_debug_view_content_lines_indented(mock_pft):
-    """DebugView prints 1 header + N content lines as ANSI with indent."""
+    """DebugView prints header + indented content lines in one FormattedText."""
     view = DebugView()
     view.render("py", "#87ff87", "line1\nline2", metadata=None)
-    assert mock_pft.call_count == 3  # 1 header + 2 content lines
-    # Content lines are ANSI-rendered with indent
-    for call in mock_pft.call_args_list[1:]:
-        arg = call[0][0]
-        assert isinstance(arg, ANSI)
-        assert arg.value.startswith("  ")
+    assert mock_pft.call_count == 1
+    ft = mock_pft.call_args[0][0]
+    assert isinstance(ft, FormattedText)
+    lines = "".join(text for _, text in ft).split("\n")
+    assert lines == ["[py]", "  line1", "  line2"]
+
+
+@patch("bae.repl.views.print_formatted_text")
+def test_debug_view_line_endings(mock_pft):
+    """CRLF and a trailing newline split the same way splitlines() would."""
+    view = DebugView()
+    view.render("py", "#87ff87", "a\r\nb\n\nc\n", metadata=None)
+    lines = "".join(text for _, text in mock_pft.call_args[0][0]).split("\n")
+    assert lines == ["[py]", "  a", "  b", "  ", "  c"]
+
+
+@patch("bae.repl.views.print_formatted_text")
+def test_debug_view_ansi_lines_isolated(mock_pft):
+    """An unterminated ANSI style on one content line does not leak into the next."""
+    view = DebugView()
+    view.render("py", "#87ff87", "\x1b[31mred\nplain", metadata=None)
+    ft = mock_pft.call_args[0][0]
+    styles = {text: style for style, text in ft}  # ANSI yields one fragment per char
+    assert styles["r"] == "ansired"
+    assert styles["p"] == ""
+
+
+@patch("bae.repl.views.print_formatted_text")
+def test_debug_view_ansi_type_single_write(mock_pft):
+    """type=ansi content follows the header in the same write, unindented."""
+    view = DebugView()
+    view.render("py", "#87ff87", "\x1b[1mbold\x1b[0m", metadata={"type": "ansi"})
+    assert mock_pft.call_count == 1
+    text = "".join(text for _, text in mock_pft.call_args[0][0])
+    assert text == "[py] type=ansi\nbold"
 
 
 def test_debug_view_satisfies_protocol():
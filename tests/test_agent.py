@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from bae.agent import extract_executable
 
 
@@ -29,3 +31,31 @@ def test_extract_executable_no_blocks():
     text = "Just plain text, no code blocks here."
     blocks = extract_executable(text)
     assert blocks == []
+
+
+def test_extract_executable_unclosed_block():
+    text = "<run>\nnever_closed()\n"
+    assert extract_executable(text) == []
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("<run>x = 1</run>", ["x = 1"]),
+        ("<run>  \n\n  indented()\n \t </run>", ["indented()"]),
+        ("<run>\n</run>", [""]),
+        ("<run> a <run> b </run>", ["a <run> b"]),
+        ("<run>\nlast()\n</run>\n<run>\nopen()", ["last()"]),
+        ("stray </run> <run>ok()</run>", ["ok()"]),
+    ],
+    ids=["inline", "whitespace", "empty", "nested-open", "trailing-unclosed", "stray-close"],
+)
+def test_extract_executable_edge_cases(text, expected):
+    """A block runs from <run> to the first </run> after it, whitespace-stripped."""
+    assert extract_executable(text) == expected
+
+
+def test_extract_executable_many_openers():
+    """The first <run> claims everything up to the close, later openers included."""
+    text = "<run>\n" * 10_000 + "<run>\ndone()\n</run>"
+    assert extract_executable(text) == ["<run>\n" * 10_000 + "done()"]
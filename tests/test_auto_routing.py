@@ -7,14 +7,15 @@ Tests:
 """
 
 import ast
-import inspect
-from unittest.mock import MagicMock, patch
+import functools
+from collections import deque
+from unittest.mock import patch
 
 import pytest
 
 from bae.lm import LM
 from bae.graph import Graph, _get_routing_strategy
-from bae.node import Node, _has_ellipsis_body
+from bae.node import Node, _has_ellipsis_body, _source_function_defs
 from bae.result import GraphResult
 
 
@@ -187,29 +188,84 @@ class PureTerminalNode(Node):
 class TestHasEllipsisBody:
     """Tests for _has_ellipsis_body() function."""
 
-    def test_ellipsis_body_returns_true(self):
-        """Method with only `...` in body returns True."""
-        assert _has_ellipsis_body(EllipsisUnionNode.__call__) is True
-        assert _has_ellipsis_body(EllipsisSingleNode.__call__) is True
-
-    def test_custom_logic_returns_false(self):
-        """Method with actual logic returns False."""
-        assert _has_ellipsis_body(CustomLogicNode.__call__) is False
-        assert _has_ellipsis_body(CustomMakeNode.__call__) is False
-        assert _has_ellipsis_body(CustomConditionNode.__call__) is False
-
-    def test_base_node_returns_false(self):
-        """Base Node.__call__ has logic, returns False."""
-        assert _has_ellipsis_body(Node.__call__) is False
-
-    def test_ellipsis_terminal_returns_true(self):
-        """Terminal node with ellipsis body returns True."""
-        assert _has_ellipsis_body(EllipsisTerminalNode.__call__) is True
-
-    def test_ellipsis_optional_returns_true(self):
-        """Optional return type with ellipsis body returns True."""
-        assert _has_ellipsis_body(EllipsisOptionalSingleNode.__call__) is True
-        assert _has_ellipsis_body(EllipsisOptionalUnionNode.__call__) is True
+    @pytest.mark.parametrize(
+        "node_cls, expected",
+        [
+            (EllipsisUnionNode, True),
+            (EllipsisSingleNode, True),
+            (EllipsisTerminalNode, True),
+            (EllipsisOptionalSingleNode, True),
+            (EllipsisOptionalUnionNode, True),
+            (CustomLogicNode, False),
+            (CustomMakeNode, False),
+            (CustomConditionNode, False),
+            (Node, False),  # base Node.__call__ has logic
+        ],
+        ids=lambda v: v.__name__ if isinstance(v, type) else None,
+    )
+    def test_has_ellipsis_body(self, node_cls, expected):
+        """Only a body of `...` (optionally after a docstring) is detected."""
+        assert _has_ellipsis_body(node_cls.__call__) is expected
+
+    def test_custom_logic_rejected_from_bytecode(self):
+        """Bodies that reference names are ruled out without reading source."""
+        uncached = _has_ellipsis_body.__wrapped__
+        with patch("bae.node.inspect.getsource") as mock_getsource:
+            assert uncached(CustomMakeNode.__call__) is False
+            assert uncached(CustomConditionNode.__call__) is False
+        mock_getsource.assert_not_called()
+
+    def test_decorated_ellipsis_body(self):
+        """A functools.wraps decorator is looked through to the ellipsis body."""
+
+        def logged(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                return await fn(*args, **kwargs)
+
+            return wrapper
+
+        class DecoratedNode(Node):
+            @logged
+            async def __call__(self) -> None: ...
+
+        assert _has_ellipsis_body.__wrapped__(DecoratedNode.__call__) is True
+
+    def test_docstring_and_pass_bodies(self):
+        """Docstring + ellipsis is auto-routed; `pass` compiles the same but is not."""
+
+        async def documented(self) -> None:
+            """Doc."""
+            ...
+
+        async def passes(self) -> None:
+            pass
+
+        assert _has_ellipsis_body(documented) is True
+        assert _has_ellipsis_body(passes) is False
+
+    def test_result_cached_per_function(self):
+        """A method's source is parsed once; later checks are cache hits."""
+        _has_ellipsis_body(EllipsisSingleNode.__call__)
+        with patch("bae.node.inspect.getsource") as mock_getsource:
+            assert _has_ellipsis_body(EllipsisSingleNode.__call__) is True
+        mock_getsource.assert_not_called()
+
+    def test_source_file_parsed_once(self):
+        """Methods from the same module share one parse of the file."""
+        uncached = _has_ellipsis_body.__wrapped__
+        _source_function_defs.cache_clear()
+        with patch("bae.node.ast.parse", wraps=ast.parse) as spy:
+            assert uncached(EllipsisUnionNode.__call__) is True
+            assert uncached(EllipsisSingleNode.__call__) is True
+            assert uncached(CustomLogicNode.__call__) is False
+        assert spy.call_count == 1
+
+    def test_unreadable_source_not_auto_routed(self):
+        """A method compiled from a string has no source to confirm `...`."""
+        ns = {}
+        exec("async def call(self) -> None: ...", ns)
+        assert _has_ellipsis_body.__wrapped__(ns["call"]) is False
 
 
 # =============================================================================
@@ -220,49 +276,56 @@ class TestHasEllipsisBody:
 class TestGetRoutingStrategy:
     """Tests for _get_routing_strategy() function."""
 
-    def test_union_ellipsis_returns_decide(self):
-        """Union return type with ellipsis body returns 'decide' strategy."""
-        strategy, types_list = _get_routing_strategy(EllipsisUnionNode)
-        assert strategy == "decide"
-        assert set(types_list) == {TargetA, TargetB}
-
-    def test_single_ellipsis_returns_make(self):
-        """Single return type with ellipsis body returns 'make' strategy."""
-        strategy, target = _get_routing_strategy(EllipsisSingleNode)
-        assert strategy == "make"
-        assert target is TargetA
-
-    def test_optional_single_ellipsis_returns_decide(self):
-        """A | None with ellipsis body returns 'decide' (choice between A and None)."""
-        strategy, types_list = _get_routing_strategy(EllipsisOptionalSingleNode)
-        assert strategy == "decide"
-        assert set(types_list) == {TargetA}
-
-    def test_optional_union_ellipsis_returns_decide(self):
-        """A | B | None with ellipsis body returns 'decide' strategy."""
-        strategy, types_list = _get_routing_strategy(EllipsisOptionalUnionNode)
-        assert strategy == "decide"
-        assert set(types_list) == {TargetA, TargetB}
-
-    def test_terminal_ellipsis_returns_terminal(self):
-        """Pure None return with ellipsis body returns 'terminal' strategy."""
-        strategy_result = _get_routing_strategy(EllipsisTerminalNode)
-        assert strategy_result == ("terminal",)
-
-    def test_custom_logic_returns_custom(self):
-        """Node with custom logic returns 'custom' strategy."""
-        strategy_result = _get_routing_strategy(CustomLogicNode)
-        assert strategy_result == ("custom",)
-
-    def test_custom_make_returns_custom(self):
-        """Node with custom make logic returns 'custom' strategy."""
-        strategy_result = _get_routing_strategy(CustomMakeNode)
-        assert strategy_result == ("custom",)
-
-    def test_base_node_returns_custom(self):
-        """Base Node class returns 'custom' strategy."""
-        strategy_result = _get_routing_strategy(Node)
-        assert strategy_result == ("custom",)
+    def test_strategy_cached_on_class(self):
+        """The strategy is computed once and stored on the class itself."""
+        first = _get_routing_strategy(EllipsisUnionNode)
+        assert EllipsisUnionNode.__dict__["__bae_routing_strategy__"] is first
+        with patch("bae.graph._compute_routing_strategy") as mock_compute:
+            assert _get_routing_strategy(EllipsisUnionNode) is first
+        mock_compute.assert_not_called()
+
+    def test_graph_resolves_strategies_up_front(self):
+        """Building a Graph stores the strategy of every node it discovers."""
+
+        class Leaf(Node):
+            async def __call__(self) -> None: ...
+
+        class Root(Node):
+            async def __call__(self) -> Leaf: ...
+
+        graph = Graph(start=Root)
+        assert set(graph.nodes) == {Root, Leaf}
+        assert Root.__dict__["__bae_routing_strategy__"] == ("make", Leaf)
+        assert Leaf.__dict__["__bae_routing_strategy__"] == ("terminal",)
+
+    def test_subclass_computes_its_own_strategy(self):
+        """A subclass overriding __call__ doesn't inherit the parent's cached strategy."""
+        _get_routing_strategy(EllipsisSingleNode)
+
+        class Sub(EllipsisSingleNode):
+            async def __call__(self) -> None: ...
+
+        assert _get_routing_strategy(Sub) == ("terminal",)
+        assert _get_routing_strategy(EllipsisSingleNode)[0] == "make"
+
+    @pytest.mark.parametrize(
+        "node_cls, expected",
+        [
+            (EllipsisUnionNode, ("decide", (TargetA, TargetB))),
+            (EllipsisSingleNode, ("make", TargetA)),
+            # A | None is a choice between A and None
+            (EllipsisOptionalSingleNode, ("decide", (TargetA,))),
+            (EllipsisOptionalUnionNode, ("decide", (TargetA, TargetB))),
+            (EllipsisTerminalNode, ("terminal",)),
+            (CustomLogicNode, ("custom",)),
+            (CustomMakeNode, ("custom",)),
+            (Node, ("custom",)),
+        ],
+        ids=lambda v: v.__name__ if isinstance(v, type) else None,
+    )
+    def test_routing_strategy(self, node_cls, expected):
+        """Ellipsis bodies route by return type; anything else is custom."""
+        assert _get_routing_strategy(node_cls) == expected
 
 
 # =============================================================================
@@ -275,45 +338,56 @@ class MockLM:
     plus v1 stubs (make/decide) for custom __call__ nodes that call them directly.
     """
 
+    __slots__ = ("_pending", "fill_calls", "choose_type_calls", "make_calls")
+
     def __init__(self, sequence: list[Node | None] | None = None):
-        self.sequence = sequence or []
-        self.index = 0
+        # Responses still to hand out: choose_type peeks, fill/make/decide consume.
+        self._pending = deque(sequence or [])
         self.fill_calls: list[tuple[type, dict, str]] = []
         self.choose_type_calls: list[tuple[list, dict]] = []
         self.make_calls: list[tuple[Node, type]] = []
 
     async def choose_type(self, types, context):
         self.choose_type_calls.append((types, context))
-        next_node = self.sequence[self.index]
+        next_node = self._pending[0]
         if next_node is None:
             return types[0]
         return type(next_node)
 
     async def fill(self, target, resolved, instruction, source=None):
         self.fill_calls.append((target, resolved, instruction))
-        result = self.sequence[self.index]
-        self.index += 1
+        result = self._pending.popleft()
         return result
 
     # v1 stubs for custom __call__ nodes that still call lm.make/decide
     async def make(self, node: Node, target: type) -> Node:
         self.make_calls.append((node, target))
-        result = self.sequence[self.index]
-        self.index += 1
+        result = self._pending.popleft()
         return result
 
     async def decide(self, node: Node) -> Node | None:
-        result = self.sequence[self.index]
-        self.index += 1
+        result = self._pending.popleft()
         return result
 
 
+# Graphs are immutable once built; arun() keeps all run state local, so the
+# same Graph is shared by every test in the module. MockLM stays per-test.
+@pytest.fixture(scope="module")
+def union_graph():
+    return Graph(start=StartUnionNode)
+
+
+@pytest.fixture(scope="module")
+def single_graph():
+    return Graph(start=StartSingleNode)
+
+
 class TestGraphRunAutoRouting:
     """Tests for Graph.run() auto-routing based on ellipsis body."""
 
-    async def test_ellipsis_union_calls_choose_type_and_fill(self):
+    async def test_ellipsis_union_calls_choose_type_and_fill(self, union_graph):
         """Ellipsis body with union return type calls choose_type then fill."""
-        graph = Graph(start=StartUnionNode)
+        graph = union_graph
         lm = MockLM(sequence=[TerminalTarget(), None])
 
         result = await graph.arun(content="test", lm=lm)
@@ -322,9 +396,9 @@ class TestGraphRunAutoRouting:
         assert len(lm.choose_type_calls) == 1
         assert len(lm.fill_calls) == 1
 
-    async def test_ellipsis_single_calls_lm_fill(self):
+    async def test_ellipsis_single_calls_lm_fill(self, single_graph):
         """Ellipsis body with single return type calls lm.fill directly."""
-        graph = Graph(start=StartSingleNode)
+        graph = single_graph
         lm = MockLM(sequence=[TerminalTarget(), None])
 
         result = await graph.arun(data="test", lm=lm)
@@ -363,9 +437,9 @@ class TestGraphRunAutoRouting:
         assert len(lm.choose_type_calls) == 0
         assert len(lm.fill_calls) == 0
 
-    async def test_graph_run_returns_graph_result(self):
+    async def test_graph_run_returns_graph_result(self, single_graph):
         """Graph.run() returns GraphResult with node and trace."""
-        graph = Graph(start=StartSingleNode)
+        graph = single_graph
         terminal = TerminalTarget()
         lm = MockLM(sequence=[terminal, None])
 
@@ -376,9 +450,9 @@ class TestGraphRunAutoRouting:
         assert result.node is None  # Terminal node returned None
         assert len(result.trace) >= 1  # At least start node
 
-    async def test_trace_includes_all_nodes(self):
+    async def test_trace_includes_all_nodes(self, single_graph):
         """GraphResult.trace includes all visited nodes in order."""
-        graph = Graph(start=StartSingleNode)
+        graph = single_graph
         mid = MidNode()
         end = TerminalTarget()
         lm = MockLM(sequence=[mid, end, None])
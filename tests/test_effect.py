@@ -148,7 +148,7 @@ class TestRoutingStrategy:
     def test_union_annotated_is_decide(self):
         strategy = _get_routing_strategy(UnionEffect)
         assert strategy[0] == "decide"
-        assert set(strategy[1]) == {Target, AltTarget}
+        assert strategy[1] == (Target, AltTarget)
 
     def test_optional_annotated_is_decide(self):
         strategy = _get_routing_strategy(OptionalEffect)
@@ -8,6 +8,7 @@ Tests:
 from __future__ import annotations
 
 from typing import Annotated
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel, Field, HttpUrl
@@ -101,6 +102,18 @@ class TestBuildPlainModel:
         )
         assert instance.vibe.mood == "happy"
 
+    def test_plain_model_built_once_per_class(self):
+        """Repeat builds for a class return the same model without re-creating it."""
+        from bae.lm import _build_plain_model, validate_plain_fields
+
+        PlainModel = _build_plain_model(NodeWithTypedPlains)
+        with patch("bae.lm.create_model") as mock_create:
+            assert _build_plain_model(NodeWithTypedPlains) is PlainModel
+            validate_plain_fields(
+                {"temp_f": 1, "summary": "s", "tags": []}, NodeWithTypedPlains
+            )
+        mock_create.assert_not_called()
+
 
 # ── validate_plain_fields ──────────────────────────────────────────────
 
@@ -12,7 +12,7 @@ import pytest
 from pydantic import BaseModel
 
 from bae.exceptions import BaeError
-from bae.graph import Graph, graph
+from bae.graph import Graph, _plain_fields, graph
 from bae.markers import Dep
 from bae.node import Node
 from bae.lm import LM
@@ -119,19 +119,64 @@ class TestGraphDiscovery:
         # Process and Review can both return None
         assert graph.terminal_nodes == {Process, Review}
 
-
-class TestGraphValidation:
-    def test_valid_graph(self):
+    def test_topology_precomputed_sorted(self):
         graph = Graph(start=Start)
-        issues = graph.validate()
-        assert issues == []
+        assert graph._edges == (
+            (Clarify, (Start,)),
+            (Process, (Review,)),
+            (Review, (Process,)),
+            (Start, (Clarify, Process)),
+        )
+        assert graph._terminals == frozenset({Process, Review})
+        # Callers get a copy, not the cached frozenset
+        graph.terminal_nodes.add(Start)
+        assert graph.terminal_nodes == {Process, Review}
+
+
+# Nodes for partial-loop validation: Fork can exit, the Spin cycle can't
+class Fork(Node):
+    async def __call__(self, lm: LM) -> SpinA | Relay:
+        return await lm.decide(self)
+
+
+class Relay(Node):
+    async def __call__(self, lm: LM) -> Exit:
+        return await lm.make(self, Exit)
+
+
+class Exit(Node):
+    async def __call__(self) -> None:
+        return None
+
+
+class SpinA(Node):
+    async def __call__(self, lm: LM) -> SpinB:
+        return await lm.make(self, SpinB)
+
 
-    def test_detects_infinite_loop(self):
-        graph = Graph(start=LoopA)
-        issues = graph.validate()
+class SpinB(Node):
+    async def __call__(self, lm: LM) -> SpinA:
+        return await lm.make(self, SpinA)
 
-        assert len(issues) == 2
-        assert any("no path to a terminal" in i for i in issues)
+
+class TestGraphValidation:
+    @pytest.mark.parametrize(
+        "start, flagged",
+        [
+            (Start, set()),
+            (LoopA, {"LoopA", "LoopB"}),
+            # Fork reaches Exit through Relay; only the Spin cycle is stuck
+            (Fork, {"SpinA", "SpinB"}),
+        ],
+        ids=["valid", "infinite-loop", "partial-loop"],
+    )
+    def test_nodes_without_terminal_path(self, start, flagged):
+        """validate() reports exactly the nodes that can't reach a terminal by any route."""
+        issues = Graph(start=start).validate()
+
+        assert len(issues) == len(flagged)
+        assert {i.split()[0] for i in issues} == flagged
+        assert all("no path to a terminal" in i for i in issues)
 
 
 class TestGraphInstanceGuard:
@@ -298,6 +343,40 @@ class TestDepCache:
         mock_sleep.assert_called_with(0)
 
 
+class PartialEnd(Node):
+    title: str
+    body: str
+    note: str = ""
+
+    async def __call__(self) -> None:
+        ...
+
+
+class PartialStart(Node):
+    async def __call__(self) -> PartialEnd:
+        return PartialEnd.model_construct(title="set by caller")
+
+
+class TestCustomCallPartialNode:
+    async def test_unset_required_fields_filled_by_lm(self):
+        """A custom __call__ node missing required fields goes through lm.fill with the set ones."""
+        lm = MockV2LM()
+
+        result = await Graph(start=PartialStart).arun(lm=lm)
+
+        assert lm.fill_calls == [(PartialEnd, {"title": "set by caller"}, "PartialEnd")]
+        assert result.trace[1].title == "set by caller"
+
+    def test_plain_fields_classified_once_per_class(self):
+        """_plain_fields caches (plain, required) per class."""
+        plain, required = _plain_fields(PartialEnd)
+        assert plain == {"title", "body", "note"}
+        assert required == {"title", "body"}
+        with patch("bae.graph.classify_fields") as spy:
+            assert _plain_fields(PartialEnd) == (plain, required)
+        spy.assert_not_called()
+
+
 # =============================================================================
 # graph() factory tests
 # =============================================================================
@@ -101,6 +101,20 @@ class TestClaudeCLIBackendChooseType:
             assert result is Farewell
             mock_cli.assert_called_once()
 
+    async def test_same_choices_share_schema(self):
+        """choose_type reuses one choice schema per set of candidate names."""
+        backend = ClaudeCLIBackend()
+
+        with patch.object(backend, "_run_cli_json", new_callable=AsyncMock) as mock_cli:
+            mock_cli.return_value = {"choice": "Greet"}
+            await backend.choose_type([Greet, Farewell], {"name": "Alice"})
+            await backend.choose_type([Greet, Farewell], {"name": "Bob"})
+            await backend.choose_type([Greet, Summarize], {"name": "Carol"})
+
+        first, second, other = (c.args[1] for c in mock_cli.call_args_list)
+        assert first is second
+        assert other != first
+
 
 # ── ClaudeCLIBackend fill ────────────────────────────────────────────────
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from bae.node import Node
 from bae.lm import LM
 
@@ -78,6 +80,20 @@ class TestNodeTopology:
         """Start cannot terminate."""
         assert Start.is_terminal() is False
 
+    def test_inherited_call_shares_hint_lookup(self):
+        """Classes inheriting Node.__call__ reuse one resolved return hint."""
+        Clarify.successors()
+        with patch("bae.node.get_type_hints") as mock_hints:
+            assert Clarify.successors() == Node.successors()
+            assert Clarify.is_terminal() is Node.is_terminal() is True
+            assert Process.is_terminal() is True
+        mock_hints.assert_not_called()
+
+    def test_successors_returns_fresh_set(self):
+        """Callers may mutate the successor set without affecting later calls."""
+        Start.successors().add(Review)
+        assert Start.successors() == {Process, Clarify}
+
 
 class TestNodeCall:
     async def test_call_with_lm_make(self):
@@ -9,12 +9,13 @@ from __future__ import annotations
 
 import inspect
 from typing import ClassVar, get_type_hints
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
 from pydantic import ConfigDict
 
 from bae.lm import LM
-from bae.node import Node, NodeConfig, _wants_lm
+from bae.node import Node, NodeConfig, _call_hints, _wants_lm
 
 
 # =============================================================================
@@ -174,3 +175,21 @@ class TestWantsLm:
     def test_base_node_call(self):
         """Base Node.__call__ has LM type hint, returns True."""
         assert _wants_lm(Node.__call__) is True
+
+    def test_hints_resolved_once_per_function(self):
+        """_wants_lm and _call_hints resolve hints once; _call_hints keeps extras, read-only."""
+
+        class NodeWithLM(Node):
+            value: str
+
+            def __call__(self, lm: LM) -> None: ...
+
+        with patch("bae.node.get_type_hints", wraps=get_type_hints) as spy:
+            assert _wants_lm(NodeWithLM.__call__) is True
+            assert _wants_lm(NodeWithLM.__call__) is True
+            hints = _call_hints(NodeWithLM.__call__)
+            assert _call_hints(NodeWithLM.__call__) is hints
+        assert spy.call_count == 2
+        assert hints["lm"] is LM
+        with pytest.raises(TypeError):
+            hints["lm"] = None
@@ -7,6 +7,7 @@ import graphlib
 import time
 from dataclasses import FrozenInstanceError
 from typing import Annotated
+from unittest.mock import patch
 
 import pytest
 
@@ -343,6 +344,18 @@ class TestRecallFromTrace:
         trace = [node]
         assert recall_from_trace(trace, str) == "real value"
 
+    def test_recall_resolves_each_class_hints_once(self):
+        """Walking a long trace resolves each node class's hints once, not once per node."""
+        trace = [
+            WeatherReport.model_construct(temperature=72, conditions="sunny"),
+            *(VibeCheck.model_construct(mood="chill") for _ in range(50)),
+        ]
+        recall_from_trace(trace, int)
+        with patch("bae.resolver.get_type_hints") as mock_hints:
+            assert recall_from_trace(trace, int) == 72
+            assert classify_fields(VibeCheck)["mood"] == "plain"
+        mock_hints.assert_not_called()
+
 
 # --- Test classes for dep DAG and validation ---
 
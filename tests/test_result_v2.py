@@ -136,3 +136,11 @@ class TestGraphResultGeneric:
 
         # .result still works without parameterization
         assert gr.result is a
+
+    def test_slotted_and_subscriptable(self):
+        """GraphResult carries no per-instance __dict__, even when parametrized."""
+        a = Alpha()
+        gr = GraphResult[Alpha](node=None, trace=[a])
+
+        assert not hasattr(gr, "__dict__")
+        assert gr.result is a